@@ -1,3 +1,13 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# suffix_trie and Dictionary_load live one directory up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from suffix_trie import SuffixTrie
+from Dictionary_load import load_dictionary_words, write_paradigm_index
+
 
 complex_suffixes = {
 
@@ -196,48 +206,178 @@ complex_suffixes = {
 add_1 = ["ು"]
 
 
-def classify_kannada_words(word):
-    flag = 0
-    classification = []  # Store classification info here
-
-    # Check for suffixes and classify
-    for category in [72, 73] + list(range(1, 72)):
-        for suffix in complex_suffixes[category]:
-            if len(word) > len(suffix) + 1 and word.endswith(suffix):
-                flag = 1
-                classification.append(category)
-                break  # Suffix matched, no need to check further in this category
-        if flag == 1:
-            break  # Suffix found and classified, no need to check further categories
-
-    if not classification:  # If no specific suffix found, classify as 'unclassified'
-        classification.append('unclassified')
+# The order the categories are tried in: suffixes to be retained first, then 1-71
+PRIORITY = [72, 73] + list(range(1, 72))
+# Inserted in priority order, so the first category at a node is the best one ending there
+SUFFIXES = SuffixTrie({category: complex_suffixes[category] for category in PRIORITY})
+RANK = {category: rank for rank, category in enumerate(PRIORITY)}
 
-    return classification
 
-# Initialize a dictionary to hold classification results
-classified_words = {}
-
-# Read words and classify
-with open("final_dictionary.txt", "r", encoding="utf-8") as file:
-    for line in file:
-        word = line.strip()
-        categories = classify_kannada_words(word)
-        for category in categories:
-            if category not in classified_words:
-                classified_words[category] = [word]
-            else:
-                classified_words[category].append(word)
+def classify_kannada_words(word):
+    """
+    [category] of the highest-priority suffix the word ends with, or ['unclassified'].
+    A suffix only counts if it leaves at least two characters of root. One backward walk of
+    the word through the compiled suffixes replaces testing all 73 tables one by one.
+    """
+    best = None
+    node = SUFFIXES.root
+    for i in range(len(word) - 1, 1, -1):
+        node = node.children.get(word[i])
+        if node is None:
+            break
+        if node.categories and (best is None or RANK[node.categories[0]] < RANK[best]):
+            best = node.categories[0]
+    return [best] if best is not None else ['unclassified']
+
+
+def classify_chunk(words):
+    return [classify_kannada_words(word)[0] for word in words]
+
+
+def classify_words(words, workers=None, chunk_size=50000):
+    """ {category: words} in first-seen order, classifying chunks of the word list in worker processes. """
+    chunks = [words[i:i + chunk_size] for i in range(0, len(words), chunk_size)]
+    if workers == 1 or len(chunks) <= 1:
+        results = list(map(classify_chunk, chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(classify_chunk, chunks))
+    classified_words = {}
+    for chunk, categories in zip(chunks, results):
+        for word, category in zip(chunk, categories):
+            classified_words.setdefault(category, []).append(word)
+    return classified_words
+
+
+def main(dictionary_path="final_dictionary.txt", output_path='Classified_Kannada_Words.txt', workers=None):
+    start_time = time.time()
+    with open(dictionary_path, "r", encoding="utf-8") as file:
+        words = [line.strip() for line in file]
+    classified_words = classify_words(words, workers)
+
+    # Write classified words to a file
+    with open(output_path, 'w', encoding='utf-8') as output_file:
+        for category, words in classified_words.items():
+            output_file.write(f"Category {category}:\n")
+            for word in words:
+                output_file.write(f"{word}\n")
+            output_file.write("\n")
+
+    print(f"Words have been classified and saved to {output_path} in {time.time() - start_time:.2f} seconds")
+
+
+# Every suffix of the tables above as one flat list, for grouping roots by the suffixes they take
+all_suffixes = [
+"ಳಿದ್ದೆ","ಳಲಿಲ್ಲ","ಳಿದ್ದೆನ","ಳಿದೆನ", "ದಿದೆವು","ದಲಿಲ್ಲ","ದಿದೆವ",
+"ಯಲಿಲ್ಲ",
+"ಯಾಗಿದ್ದರು","ವಾಗಿದ್ದರು","ತಾಗಿದ್ದರು","ದಾಗಿದ್ದರು","ದಿದ್ದರು","ಲಿಲ್ಲ","ದ್ದರಾ",
+"ಯಲಿಲ್ಲ","ಲಿಲ್ಲ","ದನ","ದನಾ",
+"ದಿದ್ದೆ","ಡಿದ್ದೆ","ರಲಿಲ್ಲ","ದ್ದೆನ","ದ್ದೆನಾ",
+"ದಿದ್ವಿ","ರಲಿಲ್ಲ","ದಿದ್ವಾ",
+"ದಿದ್ದೆ","ಯುತ್ತಿದ್ದೆ","ತ್ತಿದ್ದವರು","ತ್ತಿದ್ದೆ","ತಿದ್ದೆ","ಯುತ್ತದೆ","ತ್ತದೆ","ಯುತ್ತಿರಲಿಲ್ಲ","ತ್ತಿರಲಿಲ್ಲ","ತಿರಲಿಲ್ಲ","ದಿರಲಿಲ್ಲ","ದ್ದಿದ್ದಾ","ಯುತ್ತಿದ್ದಾ","ತ್ತಿದ್ದಾ",
+"ದಿದ್ದರು",
+"ದಿದ್ದ","ದಿದ್ದನು","ದಿದ್ದಳು",
+"ತ್ತಿದ್ದೆನೆ",
+"ಯುತ್ತಿದ್ದೆವು","ತ್ತಿದ್ದೆವು","ಯುತ್ತಿದ್ದೆವ","ತ್ತಿದ್ದೆವ",
+"ತ್ತಿದ್ದೆ","ತಿರಲಿಲ್ಲ","ತ್ತಿದ್ದ","ತ್ತಿದ್ದಾ",
+"ತ್ತಿದ್ದರು","ತ್ತಿರಲಿಲ್ಲ","ತ್ತಿದ್ದರ","ತ್ತಿದ್ದಾರಾ",
+"ಯುತ್ತಿದ್ದನ","ಯುತ್ತಿದ್ದನಾ","ಯುತ್ತಿದ್ದಳು","ಯುತ್ತಿದ್ದನು","ಯುತ್ತಿದ್ದಳ","ಯುತ್ತಿದ್ದನ","ಯುತ್ತಿದ್ದಳೆ","ಯುತ್ತಿದ್ದನೆ","ತ್ತಿದ್ದನ","ತ್ತಿದ್ದನಾ","ತ್ತಿದ್ದಳು","ತ್ತಿದ್ದನು","ತ್ತಿದ್ದಳ","ತ್ತಿದ್ದನ","ತ್ತಿದ್ದಳೆ","ತ್ತಿದ್ದನೆ",
+"ತ್ತಿದ್ದೆ","ತ್ತಿರಲಿಲ್ಲ","ತ್ತಿದ್ದೆನ","ತ್ತಿದ್ದೆನಾ",
+"ಯುತ್ತಿದ್ದೆವೆ","ತ್ತಿದ್ದೆವೆ","ಯುತ್ತಿದ್ದೆವು","ತ್ತಿದ್ದೆವು","ತ್ತಿದ್ದೆ","ತ್ತಿದ್ದೆವು","ತ್ತಿರಲಿಲ್ಲ","ತ್ತಿದ್ದಾ",
+"ತ್ತಿದ್ದರು","ತ್ತಿದ್ದರು",
+"ತ್ತಿಲ್ಲ","ತ್ತಿದ್ದಳ","ತ್ತಿದ್ದಳು","ತ್ತಿದ್ದನ","ತ್ತಿದ್ದನು","ತ್ತಿದ್ದಾರೆ",
+"ರುತ್ತೆನೆ","ತ್ತೆನೆ","ದಿಲ್ಲ","ಯಲ್ವಾ",
+"ರುತ್ತೆವೆ","ರುತ್ತೇವೆ","ರುವುದಿಲ್ಲ","ರುತ್ತೇವ","ರುತ್ತೆವ","ತ್ತೆವೆ","ತ್ತೇವೆ","ವುದಿಲ್ಲ","ತ್ತೇವ","ತ್ತೆವ",
+"ತ್ತೀಯ","ವುದಿಲ್ಲ","ತ್ತಿಯ",
+"ತ್ತಾರೆ","ತ್ತಾರ",
+"ತ್ತಾನೆ","ತ್ತಾಳೆ","ವುದಿಲ್ಲ",
+"ದ್ದಿನಿ","ದ್ದೆನೆ","ದಿಲ್ಲ","ತ್ತಿದ್ದೆ","ಲ್ಲವ","ದೆನ",
+"ದ್ದೆವೆ","ದ್ದೆವ",
+"ಡಿದ್ದೀಯ",
+"ತ್ತಿದ್ದಾರ","ತ್ತಿದ್ದಾರೆ",
+"ಯಾಗಿದೆ","ಯಾಗಿಲ್ಲ",
+"ತ್ತಿದ್ದೆನೆ","ತ್ತೆನೆ","ತ್ತೇನೆ","ತ್ತಿದ್ದೇನೆ","ತ್ತಿಲ್ಲ","ತ್ತಿದ್ದೆನ",
+"ತ್ತಿದ್ದೇವೆ","ತ್ತೇವೆ","ತ್ತಿಲ್ಲ","ತ್ತಿದ್ದೇವೆ","ತ್ತಿದ್ದೇವ",
+"ಯುತ್ತಿದ್ದೀಯ","ಯುತ್ತೀಯ","ಯುತ್ತಿರುವೆ","ಯುತ್ತಿಲ್ಲ","ಯುವುದಿಲ್ಲ","ತ್ತಿದಿಯ",
+"ತಿದರೆ","ತ್ತಿದ್ದಾರೆ","ತ್ತಿಲ್ಲ","ತ್ತಿದ್ದಾರ","ತಿರುವರ",
+"ತ್ತಿದ್ದಾನೆ","ತ್ತಿದ್ದಾಳೆ","ತ್ತಾನೆ","ತ್ತಾಳೆ","ತ್ತಿದ್ದಾನ","ತ್ತಿದ್ದಾಳ","ತ್ತಿಲ್ಲ",
+"ತ್ತಿದ್ದೀನಿ","ತ್ತಿರುವೆ","ತ್ತಿಲ್ಲ","ತ್ತಿದ್ದೀನಿ","ತ್ತಿಲ್ಲವೆ","ತ್ತಿದ್ದೇನೆ",
+"ತ್ತಿದ್ದೇವೆ","ತ್ತಿರುವ","ತ್ತಿರುವೆವು","ತ್ತಿರುವೆವ","ತ್ತಿದ್ದೇವ","ತ್ತಿದೇವ","ತ್ತಿಲ್ಲವ","ತ್ತಿಲ್ಲವಾ",
+"ತ್ತಿದೀಯ","ತ್ತಿಲ್ಲ","ತ್ತಿರುವೆಯ","ತ್ತಿದ್ದೆಯ","ತ್ತಿಲ್ಲವ",
+"ದಲ್ಲಿದೆ","ಯಲ್ಲಿದೆ","ರಲ್ಲಿದೆ",
+"ತ್ತಿದ್ದಾನೆ","ತ್ತಿದ್ದಾಳೆ","ತ್ತಿದ್ದಾಳ","ತ್ತಿದ್ದಾನೆ",
+"ಯಾದರೆ","ಗಾದರೆ","ವುದಾದರೆ","ದಾದರೆ",
+"ಯಾಗಿಯೇ","ಗಾಗಿಯೇ","ದಾಗಿಯೇ","ವಾಗಿಯೇ",
+"ವಾದರು","ಗಾದರು","ತಾದರು","ದಾದರು","ಯಾದರು","ರಾದರು","ಲಾದರು","ಳಾದರು","ವಾದರೂ","ಗಾದರೂ","ತಾದರೂ","ದಾದರೂ","ಯಾದರೂ","ರಾದರೂ","ಲಾದರರೂ","ಳಾದರೂ",
+"ತ್ತಿದ್ದರಂತೆ","ದೊಂದಿಗೆ","ಯೊಂದಿಗೆ","ರೊಂದಿಗೆ",
+"ಗಿದ್ದನು","ಗಿದ್ದಳು","ಗಿದ್ದರು","ಗಿದ್ದರೂ","ತಾದ್ದನು","ತಾದ್ದಳು","ತಾದ್ದರು","ತಾದ್ದರೂ","ದಾದ್ದನು","ದಾದ್ದಳು","ದಾದ್ದರು","ದಾದ್ದರೂ",
+"ಯೊಂದೆ","ವೊಂದೆ","ರೊಂದೆ","ವೊಂದ","ಯೊಂದ","ರೊಂದ","ವುದೇ",
+"ಯುವವರ","ರುವವರ","ಸುವವರ",
+"ದಲ್ಲೇ","ನಲ್ಲೇ","ನಲ್ಲಿ","ವಲ್ಲಿ","ದಲ್ಲಿ","ದಲ್ಲೂ","ಯಲ್ಲಿ","ರಲ್ಲಿ","ಗಳಲ್ಲಿ","ಳಲ್ಲಿ","ಯಲ್ಲಿನ",
+"ವವರು","ಯವರು","ನವರು","ರವರು","ದವರು","ವವ","ಯವ","ನವ","ರವ","ದವ",
+"ಗಾಗಿ","ದಾಗಿ","ವಾಗಿ","ರಾಗಿ","ಯಾಗಿ","ತಾಗಿ","ಕ್ಕಾಗಿ","ವಾಗಿದ್ದು","ವಾಗಿದ್ದ","ಗಾಗಿದ್ದು","ಗಾಗಿದ್ದ","ರಾಗಿದ್ದು","ರಾಗಿದ್ದ","ದಾಗಿದ್ದು","ದಾಗಿದ್ದ","ತಾಗಿದ್ದು","ತಾಗಿದ್ದ",
+"ರನ್ನ","ನನ್ನ","ಯನ್ನ",
+"ರನ್ನು","ವನ್ನು","ಯನ್ನು","ಗಳನ್ನೇ","ಗಳನ್ನು","ಳನ್ನು","ದನ್ನು" ,
+"ವಿರುವ","ರುವ","ದ್ದರೆ","ದ್ದಾರೆ",
+"ತ್ತಾರಂತೆ","ತ್ತಾಳಂತೆ","ತ್ತಾನಂತೆ","ಗಂತೆ","ದ್ದಂತೆ","ದಂತೆ","ನಂತೆ","ರಂತೆ","ಯಂತೆ","ಗಳಂತೆ","ಳಂತೆ","ವಂತೆ",
+"ಗಳೆಂದು","ಗಂ","ದ್ದಂ","ದಂ","ಯಂ","ರಂ","ವಂ","ಗಿಂದ","ದಿಂದ","ಯಿಂದ","ರಿಂದ","ನಿಂದ",
+"ನಿಗೆ","ರಿಗೆ","ಯಿಗೆ","ಕೆಗೆ",
+"ದ್ದೇನೆ","ದ್ದಾನೆ","ದ್ದಾಳೆ","ದ್ದಾರೆ","ದಾಗ",
+"ವಿದೆ" ,"ದಿದೆ","ತಿದೆ","ಗಿದೆ",
+"ತ್ತಿರು","ವೆಂದು",
+"ನನ್ನೂ","ಳನ್ನೂ","ರನ್ನೂ",
+"ಯಾಯಿತು", "ಗಾಯಿತು","ದಾಯಿತು",
+"ದ್ದನು","ದ್ದಳು","ಯಿದ್ದರು","ದ್ದರು","ದ್ದರೂ","ಗಳೇ","ಗಳು","ಗಳ","ಗಳಿ","ದಳು","ದಳ","ವೆನು","ವನು","ವೆವು","ವಳು","ವಳ","ವುದು","ಲಾಗು","ಗಳಾದ","ಗಳಿಗೆ",
+"ವುದಕ್ಕೆ","ಕ್ಕೆ","ಗ್ಗಿ","ದ್ದಿ","ಲ್ಲಿ","ನ್ನು","ತ್ತು",
+"ವಾಯಿತು","ಗಾಯಿತು","ದಾಯಿತು","ತಾಯಿತು","ಲಾಯಿತು","ನಾಯಿತು",
+"ವಿದ್ದು","ವೆಂದಾಗ",
+"ವನ್ನೇ","ವೇಕೆ",
+"ರಾದ","ವಾದ","ಗಾದ","ಯಾದ","ರಾಗುವ",
+"ವಾದುದು", "ರಾದುದು","ಗಾದುದು","ಯಾದುದು","ದಾದುದು",
+"ಯಾರು","ದಾರು","ಗಾರು","ರಾರು",
+"ಗಳಿಸಿ","ಗಳಿಸು","ಗಳಿವೆ","ಗಳಿವ","ಗಳಿವು",
+"ಯು","ದ","ವಿಕೆ","ದೇ","ರು","ಳ","ಳೆ","ಲಿದೆ","ದೆ","ರೆ","ಗೆ","ವೆ","ತೆ","ಗೂ",
+"ರದ","ಮದ","ನದ",
+"ಡಲು","ಲಾಗುತ್ತದೆ","ಸಲು","ಸಿದ್ದಾಳೆ","ಸಿದಾಗ","ಸಲು","ಸಿದರು","ಸಿದನು","ಸಿದಳು","ಸಿದ್ದೇ","ಕಿದೀನಿ"
+]
 
-# Write classified words to a file
-with open('Classified_Kannada_Words.txt', 'w', encoding='utf-8') as output_file:
-    for category, words in classified_words.items():
-        output_file.write(f"Category {category}:\n")
-        for word in words:
-            output_file.write(f"{word}\n")
-        output_file.write("\n")
 
-print("Words have been classified and saved to Classified_Kannada_Words.txt")
+def classify_roots(dictionary_words, suffixes=all_suffixes):
+    """
+    {frozenset of suffixes: roots}, grouping each root by the exact set of suffixes it is
+    attested with in the dictionary. The suffixes are compiled into a SuffixTrie and every
+    dictionary word is walked once, recording (root, suffix) for each suffix it ends with,
+    instead of testing root + suffix for every potential root and every suffix.
+    """
+    suffix_trie = SuffixTrie()
+    for suffix in suffixes:
+        suffix_trie.insert(suffix)
+    compatible_suffixes = {}
+    for word in dictionary_words:
+        for suffix, _ in suffix_trie.matches(word, min_root=1):
+            compatible_suffixes.setdefault(word[:-len(suffix)], set()).add(suffix)
+
+    root_suffix_classification = {}
+    for root, suffixes in compatible_suffixes.items():
+        root_suffix_classification.setdefault(frozenset(suffixes), []).append(root)
+    return root_suffix_classification
+
+
+def build_paradigm_index(dictionary_path="Final_dictionary.txt", output_path="paradigm_index.txt"):
+    start_time = time.time()
+    root_suffix_classification = classify_roots(load_dictionary_words(dictionary_path))
+    write_paradigm_index(root_suffix_classification, output_path)
+    print(f"{len(root_suffix_classification)} suffix combinations have been saved to {output_path} "
+          f"in {time.time() - start_time:.2f} seconds")
+
+
+if __name__ == "__main__":
+    # python Final_Kannada_Stemmer.py [dictionary output] classifies words by suffix category;
+    # python Final_Kannada_Stemmer.py --paradigms [dictionary output] groups roots by suffix set
+    if sys.argv[1:2] == ["--paradigms"]:
+        build_paradigm_index(*sys.argv[2:4])
+    else:
+        main(*sys.argv[1:3])
 
 
 
@@ -317,131 +457,3 @@ print("Root words have been saved to try.txt")
 
 
 '''
-
-
-'''
-# Path to your dictionary file
-dictionary_file_path = "Final_dictionary.txt"
-
-# Load dictionary words from the file into a set for efficient lookups
-dictionary_words = set()
-with open(dictionary_file_path, "r", encoding="utf-8") as file:
-    for line in file:
-        dictionary_words.add(line.strip())
-
-complex_suffixes = [
-"ಳಿದ್ದೆ","ಳಲಿಲ್ಲ","ಳಿದ್ದೆನ","ಳಿದೆನ", "ದಿದೆವು","ದಲಿಲ್ಲ","ದಿದೆವ",
-"ಯಲಿಲ್ಲ",
-"ಯಾಗಿದ್ದರು","ವಾಗಿದ್ದರು","ತಾಗಿದ್ದರು","ದಾಗಿದ್ದರು","ದಿದ್ದರು","ಲಿಲ್ಲ","ದ್ದರಾ",
-"ಯಲಿಲ್ಲ","ಲಿಲ್ಲ","ದನ","ದನಾ",
-"ದಿದ್ದೆ","ಡಿದ್ದೆ","ರಲಿಲ್ಲ","ದ್ದೆನ","ದ್ದೆನಾ",
-"ದಿದ್ವಿ","ರಲಿಲ್ಲ","ದಿದ್ವಾ",
-"ದಿದ್ದೆ","ಯುತ್ತಿದ್ದೆ","ತ್ತಿದ್ದವರು","ತ್ತಿದ್ದೆ","ತಿದ್ದೆ","ಯುತ್ತದೆ","ತ್ತದೆ","ಯುತ್ತಿರಲಿಲ್ಲ","ತ್ತಿರಲಿಲ್ಲ","ತಿರಲಿಲ್ಲ","ದಿರಲಿಲ್ಲ","ದ್ದಿದ್ದಾ","ಯುತ್ತಿದ್ದಾ","ತ್ತಿದ್ದಾ",
-"ದಿದ್ದರು",
-"ದಿದ್ದ","ದಿದ್ದನು","ದಿದ್ದಳು",
-"ತ್ತಿದ್ದೆನೆ",
-"ಯುತ್ತಿದ್ದೆವು","ತ್ತಿದ್ದೆವು","ಯುತ್ತಿದ್ದೆವ","ತ್ತಿದ್ದೆವ",
-"ತ್ತಿದ್ದೆ","ತಿರಲಿಲ್ಲ","ತ್ತಿದ್ದ","ತ್ತಿದ್ದಾ",
-"ತ್ತಿದ್ದರು","ತ್ತಿರಲಿಲ್ಲ","ತ್ತಿದ್ದರ","ತ್ತಿದ್ದಾರಾ",
-"ಯುತ್ತಿದ್ದನ","ಯುತ್ತಿದ್ದನಾ","ಯುತ್ತಿದ್ದಳು","ಯುತ್ತಿದ್ದನು","ಯುತ್ತಿದ್ದಳ","ಯುತ್ತಿದ್ದನ","ಯುತ್ತಿದ್ದಳೆ","ಯುತ್ತಿದ್ದನೆ","ತ್ತಿದ್ದನ","ತ್ತಿದ್ದನಾ","ತ್ತಿದ್ದಳು","ತ್ತಿದ್ದನು","ತ್ತಿದ್ದಳ","ತ್ತಿದ್ದನ","ತ್ತಿದ್ದಳೆ","ತ್ತಿದ್ದನೆ",
-"ತ್ತಿದ್ದೆ","ತ್ತಿರಲಿಲ್ಲ","ತ್ತಿದ್ದೆನ","ತ್ತಿದ್ದೆನಾ",
-"ಯುತ್ತಿದ್ದೆವೆ","ತ್ತಿದ್ದೆವೆ","ಯುತ್ತಿದ್ದೆವು","ತ್ತಿದ್ದೆವು","ತ್ತಿದ್ದೆ","ತ್ತಿದ್ದೆವು","ತ್ತಿರಲಿಲ್ಲ","ತ್ತಿದ್ದಾ",
-"ತ್ತಿದ್ದರು","ತ್ತಿದ್ದರು",
-"ತ್ತಿಲ್ಲ","ತ್ತಿದ್ದಳ","ತ್ತಿದ್ದಳು","ತ್ತಿದ್ದನ","ತ್ತಿದ್ದನು","ತ್ತಿದ್ದಾರೆ",
-"ರುತ್ತೆನೆ","ತ್ತೆನೆ","ದಿಲ್ಲ","ಯಲ್ವಾ",
-"ರುತ್ತೆವೆ","ರುತ್ತೇವೆ","ರುವುದಿಲ್ಲ","ರುತ್ತೇವ","ರುತ್ತೆವ","ತ್ತೆವೆ","ತ್ತೇವೆ","ವುದಿಲ್ಲ","ತ್ತೇವ","ತ್ತೆವ",
-"ತ್ತೀಯ","ವುದಿಲ್ಲ","ತ್ತಿಯ",
-"ತ್ತಾರೆ","ತ್ತಾರ",
-"ತ್ತಾನೆ","ತ್ತಾಳೆ","ವುದಿಲ್ಲ",
-"ದ್ದಿನಿ","ದ್ದೆನೆ","ದಿಲ್ಲ","ತ್ತಿದ್ದೆ","ಲ್ಲವ","ದೆನ",
-"ದ್ದೆವೆ","ದ್ದೆವ",
-"ಡಿದ್ದೀಯ",
-"ತ್ತಿದ್ದಾರ","ತ್ತಿದ್ದಾರೆ",
-"ಯಾಗಿದೆ","ಯಾಗಿಲ್ಲ",
-"ತ್ತಿದ್ದೆನೆ","ತ್ತೆನೆ","ತ್ತೇನೆ","ತ್ತಿದ್ದೇನೆ","ತ್ತಿಲ್ಲ","ತ್ತಿದ್ದೆನ",
-"ತ್ತಿದ್ದೇವೆ","ತ್ತೇವೆ","ತ್ತಿಲ್ಲ","ತ್ತಿದ್ದೇವೆ","ತ್ತಿದ್ದೇವ",
-"ಯುತ್ತಿದ್ದೀಯ","ಯುತ್ತೀಯ","ಯುತ್ತಿರುವೆ","ಯುತ್ತಿಲ್ಲ","ಯುವುದಿಲ್ಲ","ತ್ತಿದಿಯ",
-"ತಿದರೆ","ತ್ತಿದ್ದಾರೆ","ತ್ತಿಲ್ಲ","ತ್ತಿದ್ದಾರ","ತಿರುವರ",
-"ತ್ತಿದ್ದಾನೆ","ತ್ತಿದ್ದಾಳೆ","ತ್ತಾನೆ","ತ್ತಾಳೆ","ತ್ತಿದ್ದಾನ","ತ್ತಿದ್ದಾಳ","ತ್ತಿಲ್ಲ",
-"ತ್ತಿದ್ದೀನಿ","ತ್ತಿರುವೆ","ತ್ತಿಲ್ಲ","ತ್ತಿದ್ದೀನಿ","ತ್ತಿಲ್ಲವೆ","ತ್ತಿದ್ದೇನೆ",
-"ತ್ತಿದ್ದೇವೆ","ತ್ತಿರುವ","ತ್ತಿರುವೆವು","ತ್ತಿರುವೆವ","ತ್ತಿದ್ದೇವ","ತ್ತಿದೇವ","ತ್ತಿಲ್ಲವ","ತ್ತಿಲ್ಲವಾ",
-"ತ್ತಿದೀಯ","ತ್ತಿಲ್ಲ","ತ್ತಿರುವೆಯ","ತ್ತಿದ್ದೆಯ","ತ್ತಿಲ್ಲವ",
-"ದಲ್ಲಿದೆ","ಯಲ್ಲಿದೆ","ರಲ್ಲಿದೆ",
-"ತ್ತಿದ್ದಾನೆ","ತ್ತಿದ್ದಾಳೆ","ತ್ತಿದ್ದಾಳ","ತ್ತಿದ್ದಾನೆ",
-"ಯಾದರೆ","ಗಾದರೆ","ವುದಾದರೆ","ದಾದರೆ",
-"ಯಾಗಿಯೇ","ಗಾಗಿಯೇ","ದಾಗಿಯೇ","ವಾಗಿಯೇ",
-"ವಾದರು","ಗಾದರು","ತಾದರು","ದಾದರು","ಯಾದರು","ರಾದರು","ಲಾದರು","ಳಾದರು","ವಾದರೂ","ಗಾದರೂ","ತಾದರೂ","ದಾದರೂ","ಯಾದರೂ","ರಾದರೂ","ಲಾದರರೂ","ಳಾದರೂ",
-"ತ್ತಿದ್ದರಂತೆ","ದೊಂದಿಗೆ","ಯೊಂದಿಗೆ","ರೊಂದಿಗೆ",
-"ಗಿದ್ದನು","ಗಿದ್ದಳು","ಗಿದ್ದರು","ಗಿದ್ದರೂ","ತಾದ್ದನು","ತಾದ್ದಳು","ತಾದ್ದರು","ತಾದ್ದರೂ","ದಾದ್ದನು","ದಾದ್ದಳು","ದಾದ್ದರು","ದಾದ್ದರೂ",
-"ಯೊಂದೆ","ವೊಂದೆ","ರೊಂದೆ","ವೊಂದ","ಯೊಂದ","ರೊಂದ","ವುದೇ",
-"ಯುವವರ","ರುವವರ","ಸುವವರ",
-"ದಲ್ಲೇ","ನಲ್ಲೇ","ನಲ್ಲಿ","ವಲ್ಲಿ","ದಲ್ಲಿ","ದಲ್ಲೂ","ಯಲ್ಲಿ","ರಲ್ಲಿ","ಗಳಲ್ಲಿ","ಳಲ್ಲಿ","ಯಲ್ಲಿನ",
-"ವವರು","ಯವರು","ನವರು","ರವರು","ದವರು","ವವ","ಯವ","ನವ","ರವ","ದವ",
-"ಗಾಗಿ","ದಾಗಿ","ವಾಗಿ","ರಾಗಿ","ಯಾಗಿ","ತಾಗಿ","ಕ್ಕಾಗಿ","ವಾಗಿದ್ದು","ವಾಗಿದ್ದ","ಗಾಗಿದ್ದು","ಗಾಗಿದ್ದ","ರಾಗಿದ್ದು","ರಾಗಿದ್ದ","ದಾಗಿದ್ದು","ದಾಗಿದ್ದ","ತಾಗಿದ್ದು","ತಾಗಿದ್ದ",
-"ರನ್ನ","ನನ್ನ","ಯನ್ನ",
-"ರನ್ನು","ವನ್ನು","ಯನ್ನು","ಗಳನ್ನೇ","ಗಳನ್ನು","ಳನ್ನು","ದನ್ನು" ,
-"ವಿರುವ","ರುವ","ದ್ದರೆ","ದ್ದಾರೆ",
-"ತ್ತಾರಂತೆ","ತ್ತಾಳಂತೆ","ತ್ತಾನಂತೆ","ಗಂತೆ","ದ್ದಂತೆ","ದಂತೆ","ನಂತೆ","ರಂತೆ","ಯಂತೆ","ಗಳಂತೆ","ಳಂತೆ","ವಂತೆ",
-"ಗಳೆಂದು","ಗಂ","ದ್ದಂ","ದಂ","ಯಂ","ರಂ","ವಂ","ಗಿಂದ","ದಿಂದ","ಯಿಂದ","ರಿಂದ","ನಿಂದ",
-"ನಿಗೆ","ರಿಗೆ","ಯಿಗೆ","ಕೆಗೆ",
-"ದ್ದೇನೆ","ದ್ದಾನೆ","ದ್ದಾಳೆ","ದ್ದಾರೆ","ದಾಗ",
-"ವಿದೆ" ,"ದಿದೆ","ತಿದೆ","ಗಿದೆ",
-"ತ್ತಿರು","ವೆಂದು",
-"ನನ್ನೂ","ಳನ್ನೂ","ರನ್ನೂ",
-"ಯಾಯಿತು", "ಗಾಯಿತು","ದಾಯಿತು",
-"ದ್ದನು","ದ್ದಳು","ಯಿದ್ದರು","ದ್ದರು","ದ್ದರೂ","ಗಳೇ","ಗಳು","ಗಳ","ಗಳಿ","ದಳು","ದಳ","ವೆನು","ವನು","ವೆವು","ವಳು","ವಳ","ವುದು","ಲಾಗು","ಗಳಾದ","ಗಳಿಗೆ",
-"ವುದಕ್ಕೆ","ಕ್ಕೆ","ಗ್ಗಿ","ದ್ದಿ","ಲ್ಲಿ","ನ್ನು","ತ್ತು",
-"ವಾಯಿತು","ಗಾಯಿತು","ದಾಯಿತು","ತಾಯಿತು","ಲಾಯಿತು","ನಾಯಿತು",
-"ವಿದ್ದು","ವೆಂದಾಗ",
-"ವನ್ನೇ","ವೇಕೆ",
-"ರಾದ","ವಾದ","ಗಾದ","ಯಾದ","ರಾಗುವ",
-"ವಾದುದು", "ರಾದುದು","ಗಾದುದು","ಯಾದುದು","ದಾದುದು",
-"ಯಾರು","ದಾರು","ಗಾರು","ರಾರು",
-"ಗಳಿಸಿ","ಗಳಿಸು","ಗಳಿವೆ","ಗಳಿವ","ಗಳಿವು",
-"ಯು","ದ","ವಿಕೆ","ದೇ","ರು","ಳ","ಳೆ","ಲಿದೆ","ದೆ","ರೆ","ಗೆ","ವೆ","ತೆ","ಗೂ",
-"ರದ","ಮದ","ನದ",
-"ಡಲು","ಲಾಗುತ್ತದೆ","ಸಲು","ಸಿದ್ದಾಳೆ","ಸಿದಾಗ","ಸಲು","ಸಿದರು","ಸಿದನು","ಸಿದಳು","ಸಿದ್ದೇ","ಕಿದೀನಿ"
-]
-all_suffixes = complex_suffixes  # Direct assignment if complex_suffixes is already a list
-
-def extract_potential_roots(word, all_suffixes):
-    potential_roots = set()
-    for suffix in all_suffixes:
-        if word.endswith(suffix):
-            potential_roots.add(word[:-len(suffix)])
-    return potential_roots
-
-# Extract all potential roots from the dictionary
-potential_roots = set()
-for word in dictionary_words:
-    potential_roots.update(extract_potential_roots(word, all_suffixes))
-
-# Initialize a dictionary to hold the classifications
-root_suffix_classification = {}
-
-for root in potential_roots:
-    compatible_suffixes = []
-    for suffix in all_suffixes:
-        if root + suffix in dictionary_words:
-            compatible_suffixes.append(suffix)
-    # Use frozenset to ensure the list of suffixes can be used as a dictionary key
-    suffix_key = frozenset(compatible_suffixes)
-    if suffix_key not in root_suffix_classification:
-        root_suffix_classification[suffix_key] = [root]
-    else:
-        root_suffix_classification[suffix_key].append(root)
-        
-# Initialize a counter for file naming
-file_counter = 1
-
-for suffix_combo, roots in root_suffix_classification.items():
-    # Use a simple counter to name files uniquely
-    filename = f"sub_dict_{file_counter}.txt"
-    with open(filename, 'w', encoding='utf-8') as f:
-        for root in roots:
-            f.write(f"{root}\n")
-    file_counter += 1  # Increment the counter for the next file
-
-print("Words have been classified and saved to files.")
-
-'''
\ No newline at end of file
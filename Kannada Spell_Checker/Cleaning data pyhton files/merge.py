@@ -1,3 +1,9 @@
+import heapq
+import os
+import sys
+import tempfile
+
+
 def merge_and_deduplicate_kannada_files(file_path1, file_path2, output_file_path):
     # Use a set to store unique words
     unique_words = set()
@@ -22,9 +28,100 @@ def merge_and_deduplicate_kannada_files(file_path1, file_path2, output_file_path
     with open(output_file_path, 'w', encoding='utf-8') as outfile:
         for word in sorted(unique_words):
             outfile.write(word + '\n')
-# Usage example
-file_path1 = 'wiki.txt'  # Update this to your first file path
-file_path2 = 'Root_word_dictionary_3.txt'  # Update this to your second file path
-output_file_path = 'Final_dictionary.txt'  # Update this to your desired output file path
 
-merge_and_deduplicate_kannada_files(file_path1, file_path2, output_file_path)
+
+def _write_run(words, directory):
+    run = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory, suffix='.run', delete=False)
+    with run:
+        for word in sorted(words):
+            run.write(word + '\n')
+    return run.name
+
+
+def spill_sorted_runs(words, directory, memory_budget):
+    """ Split a stream of words into deduplicated, sorted run files of at most about memory_budget bytes. """
+    runs = []
+    unique = set()
+    used = 0
+    for word in words:
+        if word not in unique:
+            unique.add(word)
+            # The string itself plus its set slot
+            used += sys.getsizeof(word) + 64
+            if used >= memory_budget:
+                runs.append(_write_run(unique, directory))
+                unique = set()
+                used = 0
+    if unique or not runs:
+        runs.append(_write_run(unique, directory))
+    return runs
+
+
+def iter_tokens(input_paths):
+    for input_path in input_paths:
+        with open(input_path, 'r', encoding='utf-8') as infile:
+            for line in infile:
+                yield from line.split()
+
+
+def write_sorted_runs(input_paths, directory, memory_budget):
+    """ Split the tokens of all inputs into deduplicated, sorted run files of at most about memory_budget bytes. """
+    return spill_sorted_runs(iter_tokens(input_paths), directory, memory_budget)
+
+
+def merge_runs(run_paths, output_file_path):
+    """ k-way merge of sorted run files, dropping duplicates across runs. """
+    files = [open(run_path, 'r', encoding='utf-8') for run_path in run_paths]
+    try:
+        with open(output_file_path, 'w', encoding='utf-8') as outfile:
+            previous = None
+            for line in heapq.merge(*files):
+                if line != previous:
+                    outfile.write(line)
+                    previous = line
+    finally:
+        for file in files:
+            file.close()
+
+
+def merge_run_files(run_paths, output_file_path, temp_dir, fan_in=128):
+    """ Merge any number of run files into the output, in several passes of at most fan_in open files. """
+    runs = run_paths
+    while len(runs) > fan_in:
+        merged = []
+        for i in range(0, len(runs), fan_in):
+            group = runs[i:i + fan_in]
+            handle, merged_path = tempfile.mkstemp(dir=temp_dir, suffix='.run')
+            os.close(handle)
+            merge_runs(group, merged_path)
+            for run_path in group:
+                os.remove(run_path)
+            merged.append(merged_path)
+        runs = merged
+    merge_runs(runs, output_file_path)
+
+
+def external_merge_and_deduplicate(input_paths, output_file_path, memory_budget=256 << 20, fan_in=128):
+    """
+    Streaming version of merge_and_deduplicate_kannada_files for any number of inputs: tokens are
+    collected into sorted runs that fit in memory_budget, spilled to temporary files, then
+    k-way merged with deduplication. Memory stays flat however large the corpus; more than
+    fan_in runs are merged in several passes to bound the number of open files.
+    The output is identical to the in-memory version.
+    """
+    directory = os.path.dirname(os.path.abspath(output_file_path))
+    with tempfile.TemporaryDirectory(dir=directory) as temp_dir:
+        runs = write_sorted_runs(input_paths, temp_dir, memory_budget)
+        merge_run_files(runs, output_file_path, temp_dir, fan_in)
+    return output_file_path
+
+
+if __name__ == "__main__":
+    # Usage: python merge.py [output_file input_file ...]
+    if len(sys.argv) > 2:
+        output_file_path, input_paths = sys.argv[1], sys.argv[2:]
+    else:
+        input_paths = ['wiki.txt', 'Root_word_dictionary_3.txt']  # Update these to your input files
+        output_file_path = 'Final_dictionary.txt'  # Update this to your desired output file path
+
+    external_merge_and_deduplicate(input_paths, output_file_path)
@@ -0,0 +1,139 @@
+import argparse
+import hashlib
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+import unicodedata
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# The dictionary and checker modules live one directory up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Dictionary_load import atomic_output, complex_suffixes, load_dictionary_words, categorize_words, write_categorized_results
+from incremental_build import file_hash, tables_hash
+from merge import spill_sorted_runs, merge_run_files
+from vec_large import extract_words_parallel
+import Final_Kannada_Stemmer as stemmer
+
+# Bump a stage's version when its logic changes so its cached outputs are rebuilt
+STAGE_VERSIONS = {'vec': 1, 'clean': 1, 'stem': 1, 'categorize': 1}
+# Everything outside the Kannada block except the zero-width joiners Kannada spelling uses
+NON_KANNADA = re.compile('[^\u0C80-\u0CFF\u200C\u200D]+')
+
+
+def clean_lines(lines):
+    """ Normalise, keep only Kannada, tokenise and dedup one batch of lines; empty lines yield nothing. """
+    words = set()
+    for line in lines:
+        words.update(NON_KANNADA.sub(' ', unicodedata.normalize('NFC', line)).split())
+    return words
+
+
+def iter_batches(input_paths, batch_lines):
+    for input_path in input_paths:
+        with open(input_path, 'r', encoding='utf-8', errors='replace') as infile:
+            batch = []
+            for line in infile:
+                batch.append(line)
+                if len(batch) == batch_lines:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+
+def iter_cleaned_words(input_paths, workers=None, batch_lines=20000, max_pending=None):
+    """
+    Stream the inputs through clean_lines in worker processes. At most max_pending batches are
+    in flight, so a slow consumer bounds memory instead of the reader racing ahead.
+    """
+    workers = workers or os.cpu_count()
+    max_pending = max_pending or 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for batch in iter_batches(input_paths, batch_lines):
+            pending.append(pool.submit(clean_lines, batch))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def clean_corpus(input_paths, output_path, workers=None, memory_budget=256 << 20):
+    """ One pass from raw text files to a sorted, deduplicated Kannada word list. """
+    directory = os.path.dirname(os.path.abspath(output_path))
+    with tempfile.TemporaryDirectory(dir=directory) as temp_dir:
+        runs = spill_sorted_runs(iter_cleaned_words(input_paths, workers), temp_dir, memory_budget)
+        merge_run_files(runs, output_path, temp_dir)
+
+
+def categorize_dictionary(dictionary_path, output_path, workers=None):
+    dictionary_words = load_dictionary_words(dictionary_path)
+    categorized_roots, all_categorized_words = categorize_words(dictionary_words, workers=workers or 1)
+    write_categorized_results(categorized_roots, all_categorized_words, dictionary_words, output_path)
+
+
+def run_stage(name, input_paths, output_path, build, cache_dir, dependencies=()):
+    """
+    Run build(output_path) unless an earlier run had the same inputs, in which case its cached
+    output is copied instead. The cache key hashes the stage name, the stage version, the
+    content of every input file and any other dependency hashes, e.g. of the suffix tables.
+    """
+    key = hashlib.sha256(repr((name, STAGE_VERSIONS[name])).encode('utf-8'))
+    for input_path in input_paths:
+        key.update(file_hash(input_path).encode('ascii'))
+    for dependency in dependencies:
+        key.update(dependency.encode('ascii'))
+    cached_path = os.path.join(cache_dir, f"{name}-{key.hexdigest()[:20]}.txt")
+
+    start_time = time.time()
+    if os.path.exists(cached_path):
+        shutil.copyfile(cached_path, output_path)
+        print(f"{name}: inputs unchanged, reused {cached_path}")
+        return output_path
+    build(output_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    with atomic_output(cached_path) as temp_path:
+        shutil.copyfile(output_path, temp_path)
+    print(f"{name}: built {output_path} in {time.time() - start_time:.2f} seconds")
+    return output_path
+
+
+def run_pipeline(corpus_paths, vec_path=None, root_paths=(), output_dir='.', cache_dir='.pipeline_cache', workers=None):
+    """
+    Raw corpora (+ an optional fastText .vec vocabulary and root word lists) -> Final_dictionary.txt
+    -> Classified_Kannada_Words.txt and categorized.txt. Replaces running kannada_clean.py,
+    vec_large.py, merge.py, Final_Kannada_Stemmer.py and Dictionary_load.py by hand, and skips
+    every stage whose inputs did not change.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    sources = list(corpus_paths) + list(root_paths)
+    if vec_path:
+        vec_words = run_stage("vec", [vec_path], os.path.join(output_dir, 'extracted_words.txt'),
+                              lambda out: extract_words_parallel(vec_path, out, workers), cache_dir)
+        sources.append(vec_words)
+
+    dictionary_path = run_stage("clean", sources, os.path.join(output_dir, 'Final_dictionary.txt'),
+                                lambda out: clean_corpus(sources, out, workers), cache_dir)
+    # The stemmer's suffix categories are its own copy of the tables, so they are hashed separately
+    run_stage("stem", [dictionary_path], os.path.join(output_dir, 'Classified_Kannada_Words.txt'),
+              lambda out: stemmer.main(dictionary_path, out, workers), cache_dir,
+              [tables_hash(stemmer.complex_suffixes)])
+    return run_stage("categorize", [dictionary_path], os.path.join(output_dir, 'categorized.txt'),
+                     lambda out: categorize_dictionary(dictionary_path, out, workers), cache_dir,
+                     [tables_hash(complex_suffixes)])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build Final_dictionary.txt, Classified_Kannada_Words.txt and categorized.txt from raw text.")
+    parser.add_argument("corpus", nargs="+", help="raw text files, e.g. a Wikipedia dump")
+    parser.add_argument("--vec", help="fastText .vec file whose vocabulary is added")
+    parser.add_argument("--roots", nargs="*", default=[], help="root word lists, e.g. Root_word_dictionary_3.txt")
+    parser.add_argument("--output-dir", default=".")
+    parser.add_argument("--cache-dir", default=".pipeline_cache")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    run_pipeline(args.corpus, args.vec, args.roots, args.output_dir, args.cache_dir, args.workers)
@@ -1,3 +1,36 @@
+import os
+import re
+import struct
+import sys
+import tempfile
+from array import array
+from itertools import accumulate
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from suffix_trie import SuffixTrie
+
+@contextmanager
+def atomic_output(file_path):
+    """
+    Yields a fresh temporary path next to file_path; it replaces file_path when the block
+    finishes and is removed if the block fails. Concurrent writers never share a temporary
+    file, so the last complete one wins and readers never see a partial file.
+    """
+    directory, name = os.path.split(os.path.abspath(file_path))
+    handle, temp_path = tempfile.mkstemp(dir=directory, prefix=name + ".", suffix=".tmp")
+    os.close(handle)
+    try:
+        yield temp_path
+        os.replace(temp_path, file_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def source_stamp(file_path):
+    """ (size, mtime in ns) of a source file; saved indexes record it and are rebuilt when it changes. """
+    stat = os.stat(file_path)
+    return (stat.st_size, stat.st_mtime_ns)
+
 def load_dictionary_words(file_path):
     dictionary_words = set()
     with open(file_path, "r", encoding="utf-8") as file:
@@ -5,63 +38,178 @@ def load_dictionary_words(file_path):
             dictionary_words.add(line.strip())
     return dictionary_words
 
+complex_suffixes = {
+    1: ["ತ್ತಿದ್ದಳು","ತ್ತಿದ್ದನು","ತ್ತಿದ್ದಾರೆ","ತ್ತೀಯ","ತ್ತಾರೆ"], #present tense of verbs
+    2: ["ಗಳನ್ನು", "ಗಳಲ್ಲಿ", "ಗಳ"],
+    3: ["ದ್ದನು","ದ್ದಳು","ದ್ದರು"],  #past tense of verbs
+    4: ["ದ", "ದಲ್ಲಿ", "ದಿಂದ"],
+}
+
+def strip_suffixes(words, suffix_tables):
+    """ One pass over the words: {category: {root: suffixes seen after that root}}. """
+    suffixes = SuffixTrie(suffix_tables)
+    candidates = {category: {} for category in suffix_tables}
+    for word in words:
+        for suffix, categories in suffixes.matches(word):
+            root = word[:-len(suffix)]
+            for category in categories:
+                candidates[category].setdefault(root, set()).add(suffix)
+    return candidates
+
 #Rule based suffix stripping
-def categorize_words(dictionary_words):
-    complex_suffixes = {
-        1: ["ತ್ತಿದ್ದಳು","ತ್ತಿದ್ದನು","ತ್ತಿದ್ದಾರೆ","ತ್ತೀಯ","ತ್ತಾರೆ"], #present tense of verbs
-        2: ["ಗಳನ್ನು", "ಗಳಲ್ಲಿ", "ಗಳ"],
-        3: ["ದ್ದನು","ದ್ದಳು","ದ್ದರು"],  #past tense of verbs
-        4: ["ದ", "ದಲ್ಲಿ", "ದಿಂದ"],
-    }
-    categorized_roots = {category: set() for category in complex_suffixes}
-    all_categorized_words = set()
+def categorize_words(dictionary_words, suffix_tables=complex_suffixes, workers=1, chunk_size=200000):
+    """
+    A root joins a category when the dictionary holds root + every suffix of that category.
+    Words are stripped of their candidate suffixes and grouped by root in a single pass, and
+    each root's paradigm is checked once. With workers > 1 the stripping is sharded across
+    processes in chunks of chunk_size words and the partial groups are merged.
+    """
+    words = list(dictionary_words)
+    if workers > 1 and len(words) > chunk_size:
+        chunks = [words[i:i + chunk_size] for i in range(0, len(words), chunk_size)]
+        candidates = {category: {} for category in suffix_tables}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for partial in pool.map(strip_suffixes, chunks, [suffix_tables] * len(chunks)):
+                for category, roots in partial.items():
+                    merged = candidates[category]
+                    for root, seen in roots.items():
+                        if root in merged:
+                            merged[root] |= seen
+                        else:
+                            merged[root] = seen
+    else:
+        candidates = strip_suffixes(words, suffix_tables)
 
-    for word in dictionary_words:
-        for category, suffixes in complex_suffixes.items():
-            for suffix in suffixes:
-                if word.endswith(suffix):
-                    root = word[:-len(suffix)]
-                    if all(root + s in dictionary_words for s in suffixes):
-                        categorized_roots[category].add(root)
-                        all_categorized_words.add(word)
+    categorized_roots = {category: set() for category in suffix_tables}
+    all_categorized_words = set()
+    for category, suffixes in suffix_tables.items():
+        paradigm = set(suffixes)
+        for root, seen in candidates[category].items():
+            if seen == paradigm:
+                categorized_roots[category].add(root)
+                all_categorized_words.update(root + suffix for suffix in paradigm)
 
     return categorized_roots, all_categorized_words
 
-def write_categorized_results(categorized_roots, all_categorized_words, dictionary_words, file_path):
+CATEGORY_HEADER = re.compile(r"Category (\S+):")
+PARADIGM_HEADER = re.compile(r"Paradigm (\S+): (.*)")
+BINARY_MAGIC = b"KNCAT1\n\x00"
+# Binary section: header (category name bytes, word count, word text bytes), the name, one
+# little-endian uint16 length in characters per word, then all words concatenated as UTF-8
+BINARY_SECTION = struct.Struct("<HII")
+
+def write_categorized_results(categorized_roots, all_categorized_words, dictionary_words, file_path, binary=False):
     uncategorized_words = dictionary_words - all_categorized_words
     all_categorized_roots = set()
     for roots in categorized_roots.values():
         all_categorized_roots.update(roots)
     filtered_uncategorized_words = sorted([word for word in uncategorized_words if word not in all_categorized_roots])
 
+    if binary:
+        sections = [(str(category), sorted(roots)) for category, roots in categorized_roots.items()]
+        sections.append(("Uncategorized", filtered_uncategorized_words))
+        write_categorized_binary(sections, file_path)
+        return
+
     with open(file_path, "w", encoding="utf-8") as f:
         for category, roots in categorized_roots.items():
             f.write(f"Category {category}:\n" + "\n".join(sorted(roots)) + "\n\n")
         f.write("Uncategorized:\n" + "\n".join(filtered_uncategorized_words))
 
-def read_categorized_file(file_path):
-    sub_dictionaries = {}
-    with open(file_path, "r", encoding="utf-8") as file:
-        lines = file.readlines()
+def write_categorized_binary(sections, file_path):
+    """ Length-prefixed categorized file: no line parsing, and each section is decoded with one call. """
+    with open(file_path, "wb") as f:
+        f.write(BINARY_MAGIC)
+        for category, words in sections:
+            name = category.encode("utf-8")
+            lengths = array("H", map(len, words))
+            if sys.byteorder == "big":
+                lengths.byteswap()
+            text = "".join(words).encode("utf-8")
+            f.write(BINARY_SECTION.pack(len(name), len(words), len(text)) + name)
+            lengths.tofile(f)
+            f.write(text)
+
+def _parse_categorized(file_path):
+    # Yields (category, word) pairs, plus (category, None) at the start of every section
+    with open(file_path, "rb") as file:
+        binary = file.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+        if binary:
+            while True:
+                header = file.read(BINARY_SECTION.size)
+                if not header:
+                    return
+                name_length, count, text_length = BINARY_SECTION.unpack(header)
+                category = file.read(name_length).decode("utf-8")
+                lengths = array("H")
+                lengths.frombytes(file.read(2 * count))
+                if sys.byteorder == "big":
+                    lengths.byteswap()
+                text = file.read(text_length).decode("utf-8")
+                yield category, None
+                start = 0
+                for end in accumulate(lengths):
+                    yield category, text[start:end]
+                    start = end
 
     current_category = None
-    for line in lines:
-        line = line.strip()
-        if "Category" in line:
-            current_category = line.split(":")[0].split(" ")[1]
-            sub_dictionaries[current_category] = set()
-        elif "Uncategorized" in line:
-            current_category = "Uncategorized"
-            sub_dictionaries[current_category] = set()
-        elif line and current_category:
-            sub_dictionaries[current_category].add(line)
+    with open(file_path, "r", encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            header = CATEGORY_HEADER.fullmatch(line)
+            if header:
+                current_category = header.group(1)
+                yield current_category, None
+            elif line == "Uncategorized:":
+                current_category = "Uncategorized"
+                yield current_category, None
+            elif line and current_category:
+                yield current_category, line
+
+def iter_categorized_file(file_path):
+    """ Stream (category, word) pairs from a text or binary categorized file without loading it. """
+    for category, word in _parse_categorized(file_path):
+        if word is not None:
+            yield category, word
+
+def read_categorized_file(file_path):
+    sub_dictionaries = {}
+    for category, word in _parse_categorized(file_path):
+        if word is None:
+            sub_dictionaries[category] = set()
+        else:
+            sub_dictionaries[category].add(word)
 
     return sub_dictionaries
 
-def main():
+def write_paradigm_index(root_suffix_classification, file_path):
+    """
+    One file for {frozenset of suffixes: roots}: a "Paradigm P<n>: <suffixes>" line per suffix
+    combination, then a "Category P<n>:" section with its roots. The sections are ordinary
+    categorized-file sections, so setup_trie and read_categorized_file load it as is.
+    """
+    paradigms = sorted(root_suffix_classification.items(), key=lambda item: (-len(item[1]), sorted(item[0])))
+    with open(file_path, "w", encoding="utf-8") as f:
+        for number, (suffixes, _) in enumerate(paradigms, 1):
+            f.write(f"Paradigm P{number}: " + "\t".join(sorted(suffixes)) + "\n")
+        for number, (_, roots) in enumerate(paradigms, 1):
+            f.write(f"\nCategory P{number}:\n" + "\n".join(sorted(roots)) + "\n")
+
+def read_paradigm_index(file_path):
+    """ ({paradigm: [suffixes]}, {paradigm: roots}) from a file written by write_paradigm_index. """
+    paradigms = {}
+    with open(file_path, "r", encoding="utf-8") as file:
+        for line in file:
+            signature = PARADIGM_HEADER.fullmatch(line.rstrip("\n"))
+            if not signature:
+                break
+            paradigms[signature.group(1)] = signature.group(2).split("\t")
+    return paradigms, read_categorized_file(file_path)
+
+def main(workers=1):
     file_path = "Final_dictionary.txt"
     dictionary_words = load_dictionary_words(file_path)
-    categorized_roots, all_categorized_words = categorize_words(dictionary_words)
+    categorized_roots, all_categorized_words = categorize_words(dictionary_words, workers=workers)
     write_categorized_results(categorized_roots, all_categorized_words, dictionary_words, "categorized.txt")
     sub_dictionaries = read_categorized_file("categorized.txt")
 
@@ -72,4 +220,4 @@ def main():
     
 
 if __name__ == "__main__":
-    main()
+    main(*map(int, sys.argv[1:2]))
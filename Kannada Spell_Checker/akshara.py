@@ -0,0 +1,123 @@
+import heapq
+import Levenshtein as lev
+
+# Marks that never start an akshara: candrabindu, anusvara, visarga, nukta, dependent vowel signs,
+# virama, length marks, vocalic vowel signs, and the zero-width (non-)joiners
+COMBINING_MARKS = set(
+    ['ಁ', 'ಂ', 'ಃ', '಼', '್', 'ೕ', 'ೖ', 'ೢ', 'ೣ', '\u200c', '\u200d']
+    + [chr(c) for c in range(0x0CBE, 0x0CCD)]
+)
+VIRAMA = '್'
+JOINERS = '\u200c\u200d'
+
+
+def is_consonant(char):
+    return 'ಕ' <= char <= 'ಹ' or char == 'ೞ'
+
+
+def split_aksharas(word):
+    """ Split a Kannada word into aksharas: consonant conjuncts plus their vowel sign and modifiers. """
+    aksharas = []
+    for char in word:
+        if aksharas and (char in COMBINING_MARKS
+                         or (is_consonant(char) and aksharas[-1].rstrip(JOINERS).endswith(VIRAMA))):
+            aksharas[-1] += char
+        else:
+            aksharas.append(char)
+    return aksharas
+
+
+class AksharaEncoder:
+    """
+    Interns aksharas to small integer IDs. An encoded word is a str whose code points are the
+    IDs, i.e. a compact integer array that Levenshtein can compare directly in C.
+    """
+    def __init__(self):
+        self.ids = {}
+        self.aksharas = []
+
+    def intern(self, akshara):
+        akshara_id = self.ids.get(akshara)
+        if akshara_id is None:
+            akshara_id = len(self.aksharas)
+            self.ids[akshara] = akshara_id
+            self.aksharas.append(akshara)
+        return akshara_id
+
+    def encode(self, word):
+        return ''.join(_id_to_char(self.intern(akshara)) for akshara in split_aksharas(word))
+
+    def encode_query(self, word):
+        """
+        Encode without growing the table: an akshara never interned gets a temporary ID past
+        the end of the table, which matches nothing stored. Use this for queries.
+        """
+        unseen = {}
+        ids = []
+        for akshara in split_aksharas(word):
+            akshara_id = self.ids.get(akshara)
+            if akshara_id is None:
+                akshara_id = unseen.setdefault(akshara, len(self.aksharas) + len(unseen))
+            ids.append(akshara_id)
+        return ''.join(map(_id_to_char, ids))
+
+    def decode(self, encoded):
+        return ''.join(self.aksharas[_char_to_id(char)] for char in encoded)
+
+
+def _id_to_char(akshara_id):
+    # Skip the surrogate block so every ID is a valid code point
+    return chr(akshara_id if akshara_id < 0xD800 else akshara_id + 0x800)
+
+
+def _char_to_id(char):
+    code = ord(char)
+    return code if code < 0xD800 else code - 0x800
+
+
+def akshara_distance(word1, word2, encoder):
+    """ Levenshtein distance counted in aksharas rather than code points. """
+    return lev.distance(encoder.encode(word1), encoder.encode(word2))
+
+
+class AksharaIndex:
+    """
+    Dictionary words stored once as akshara-ID arrays. Suggestions are ranked by akshara edit
+    distance, so a matra or virama slip costs one edit like any other akshara substitution.
+    Ties are broken by code-point distance, then dictionary order.
+    """
+    def __init__(self, encoder=None):
+        self.encoder = encoder or AksharaEncoder()
+        self.words = []
+        self.encoded_words = []
+
+    def insert(self, word):
+        self.words.append(word)
+        self.encoded_words.append(self.encoder.encode(word))
+
+    @classmethod
+    def from_trie(cls, trie):
+        index = cls()
+        for word in trie.iter_words():
+            index.insert(word)
+        return index
+
+    def fuzzy_search(self, word, max_distance=None, k=8):
+        if k <= 0:
+            return []
+        encoded = self.encoder.encode_query(word)
+        scored = [
+            (lev.distance(encoded, candidate, score_cutoff=max_distance), position)
+            for position, candidate in enumerate(self.encoded_words)
+        ]
+        if max_distance is not None:
+            scored = [pair for pair in scored if pair[0] <= max_distance]
+        top = heapq.nsmallest(k, scored)
+        if not top:
+            return []
+        # Re-rank everything tied with the k-th akshara distance by code-point distance
+        kth_distance = top[-1][0]
+        tied = [(distance, lev.distance(word, self.words[position]), position)
+                for distance, position in scored if distance <= kth_distance]
+        tied.sort()
+        return [(self.words[position], distance) for distance, _, position in tied[:k]]
@@ -0,0 +1,106 @@
+import numpy as np
+
+MAX_CELLS = 4_000_000  # Upper bound on the DP cells held in memory for one bucket/query chunk
+
+
+def encode_words(words):
+    """ Pack equal-length words into an (n, length) array of code points. """
+    length = len(words[0]) if words else 0
+    if length == 0:
+        return np.zeros((len(words), 0), dtype=np.uint32)
+    return np.frombuffer(''.join(words).encode('utf-32-le'), dtype=np.uint32).reshape(len(words), length)
+
+
+def bucket_distances(queries, codes):
+    """
+    Levenshtein distance between every query (q, m) and every word (n, L) in one bucket.
+    The DP runs one query character at a time over the whole (q, n, L) block. The left-to-right
+    insertion dependency inside a row is resolved with a running minimum:
+    D[j] = min over i <= j of (T[i] + j - i) = j + cummin(T[i] - i).
+    """
+    q, m = queries.shape
+    n, length = codes.shape
+    offsets = np.arange(length + 1, dtype=np.int32)
+    prev = np.broadcast_to(offsets, (q, n, length + 1)).copy()
+    for i in range(m):
+        cost = (codes[None, :, :] != queries[:, i, None, None]).astype(np.int32)
+        row = np.empty_like(prev)
+        row[:, :, 0] = i + 1
+        np.minimum(prev[:, :, 1:] + 1, prev[:, :, :-1] + cost, out=row[:, :, 1:])
+        row -= offsets
+        np.minimum.accumulate(row, axis=2, out=row)
+        row += offsets
+        prev = row
+    return prev[:, :, length]
+
+
+class BatchLevenshtein:
+    """
+    Dictionary words bucketed by length into NumPy arrays. Edit distances for a whole bucket
+    are computed at once, and buckets whose length difference already exceeds the current k-th
+    best distance are skipped. Ties keep dictionary order, matching a full scan sorted by distance.
+    """
+    def __init__(self, words):
+        self.words = list(words)
+        by_length = {}
+        for position, word in enumerate(self.words):
+            by_length.setdefault(len(word), []).append(position)
+        self.buckets = {
+            length: (np.array(positions, dtype=np.int64), encode_words([self.words[p] for p in positions]))
+            for length, positions in by_length.items()
+        }
+
+    @classmethod
+    def from_trie(cls, trie):
+        return cls(trie.get_all_words())
+
+    def fuzzy_search(self, word, max_distance=None, k=8):
+        return self.fuzzy_search_many([word], max_distance=max_distance, k=k)[0]
+
+    def fuzzy_search_many(self, words, max_distance=None, k=8):
+        """ Top-k (word, distance) pairs for every query, batching queries of the same length. """
+        results = [[] for _ in words]
+        if k <= 0:
+            return results
+        queries_by_length = {}
+        for query_index, word in enumerate(words):
+            queries_by_length.setdefault(len(word), []).append(query_index)
+
+        for m, query_indices in queries_by_length.items():
+            query_codes = encode_words([words[i] for i in query_indices])
+            # Per query: best distances and dictionary positions found so far
+            best_distances = [np.empty(0, dtype=np.int32) for _ in query_indices]
+            best_positions = [np.empty(0, dtype=np.int64) for _ in query_indices]
+
+            for length in sorted(self.buckets, key=lambda length: abs(length - m)):
+                gap = abs(length - m)
+                if max_distance is not None and gap > max_distance:
+                    break
+                active = [
+                    slot for slot in range(len(query_indices))
+                    if len(best_distances[slot]) < k or gap <= best_distances[slot][-1]
+                ]
+                if not active:
+                    break  # Later buckets only have a larger length gap
+                positions, codes = self.buckets[length]
+                chunk_size = max(1, MAX_CELLS // max(1, len(positions) * (length + 1)))
+                for start in range(0, len(active), chunk_size):
+                    chunk = active[start:start + chunk_size]
+                    distances = bucket_distances(query_codes[chunk], codes)
+                    for row, slot in zip(distances, chunk):
+                        merged_distances = np.concatenate([best_distances[slot], row])
+                        merged_positions = np.concatenate([best_positions[slot], positions])
+                        if max_distance is not None:
+                            keep = merged_distances <= max_distance
+                            merged_distances = merged_distances[keep]
+                            merged_positions = merged_positions[keep]
+                        order = np.lexsort((merged_positions, merged_distances))[:k]
+                        best_distances[slot] = merged_distances[order]
+                        best_positions[slot] = merged_positions[order]
+
+            for slot, query_index in enumerate(query_indices):
+                results[query_index] = [
+                    (self.words[position], int(distance))
+                    for distance, position in zip(best_distances[slot], best_positions[slot])
+                ]
+        return results
@@ -0,0 +1,90 @@
+import random
+import sys
+import time
+import Levenshtein as lev
+from trie import Trie
+from bktree import BKTree
+from symspell import build_symspell_index
+from ngram_index import NGramIndex
+from Dictionary_load import read_categorized_file
+
+
+class LinearScan:
+    """ The original brute-force engine: score every word and sort. """
+    def __init__(self, words):
+        self.words = words
+
+    def fuzzy_search(self, word, max_distance=None, k=8):
+        scored = [(candidate, lev.distance(word, candidate)) for candidate in self.words]
+        if max_distance is not None:
+            scored = [pair for pair in scored if pair[1] <= max_distance]
+        scored.sort(key=lambda x: x[1])
+        return scored[:k]
+
+
+def make_queries(words, count, seed=0):
+    """ Misspell random dictionary words with one random deletion, insertion or substitution. """
+    rng = random.Random(seed)
+    kannada_chars = [chr(c) for c in range(0x0C80, 0x0D00)]
+    queries = []
+    for word in rng.sample(words, min(count, len(words))):
+        i = rng.randrange(len(word))
+        edit = rng.choice(("delete", "insert", "substitute"))
+        if edit == "delete":
+            queries.append(word[:i] + word[i + 1:])
+        elif edit == "insert":
+            queries.append(word[:i] + rng.choice(kannada_chars) + word[i:])
+        else:
+            queries.append(word[:i] + rng.choice(kannada_chars) + word[i + 1:])
+    return queries
+
+
+def time_engine(engine, queries, max_distance, k):
+    start_time = time.perf_counter()
+    results = [engine.fuzzy_search(query, max_distance=max_distance, k=k) for query in queries]
+    return time.perf_counter() - start_time, results
+
+
+def main(categorized_path="categorized.txt", query_count=100, k=8):
+    sub_dictionaries = read_categorized_file(categorized_path)
+
+    start_time = time.perf_counter()
+    trie = Trie()
+    for category, words in sub_dictionaries.items():
+        for word in words:
+            trie.insert(word, category)
+    words = trie.get_all_words()
+    print(f"Trie: {len(words)} words built in {time.perf_counter() - start_time:.2f} seconds")
+
+    start_time = time.perf_counter()
+    bktree = BKTree.from_trie(trie)
+    print(f"BK-tree built in {time.perf_counter() - start_time:.2f} seconds")
+
+    start_time = time.perf_counter()
+    symspell = build_symspell_index(sub_dictionaries)
+    print(f"SymSpell index built in {time.perf_counter() - start_time:.2f} seconds")
+
+    start_time = time.perf_counter()
+    ngrams = NGramIndex.from_trie(trie)
+    print(f"Trigram index built in {time.perf_counter() - start_time:.2f} seconds")
+
+    engines = [("linear scan", LinearScan(words)), ("trie walk", trie), ("BK-tree", bktree), ("SymSpell", symspell),
+               ("trigrams", ngrams)]
+    queries = make_queries(words, query_count)
+
+    # Unbounded top-k (SymSpell is limited to its index distance) and radius-2 lookups
+    for max_distance in (None, 2):
+        print(f"\nTop-{k} suggestions, max_distance={max_distance}, {len(queries)} queries")
+        baseline = None
+        for name, engine in engines:
+            elapsed, results = time_engine(engine, queries, max_distance, k)
+            distances = [[d for _, d in result] for result in results]
+            if baseline is None:
+                baseline = distances
+            agreement = sum(a == b for a, b in zip(distances, baseline)) / len(queries) * 100
+            print(f"{name:12} {elapsed / len(queries) * 1000:9.2f} ms/query   "
+                  f"same distances as linear scan: {agreement:.0f}%")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
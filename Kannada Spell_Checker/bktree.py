@@ -0,0 +1,75 @@
+import heapq
+import Levenshtein as lev
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree over dictionary words with Levenshtein distance as the metric.
+    Each child edge is labelled with its distance to the parent word, so by the triangle
+    inequality only children labelled within [d - radius, d + radius] can hold a match.
+    """
+    def __init__(self, distance=lev.distance):
+        self.distance = distance
+        self.root = None  # Nodes are [word, insertion order, {edge distance: child node}]
+        self.size = 0
+
+    def insert(self, word):
+        new_node = [word, self.size, {}]
+        if self.root is None:
+            self.root = new_node
+            self.size += 1
+            return
+        node = self.root
+        while True:
+            d = self.distance(word, node[0])
+            if d == 0:
+                return
+            child = node[2].get(d)
+            if child is None:
+                node[2][d] = new_node
+                self.size += 1
+                return
+            node = child
+
+    @classmethod
+    def from_trie(cls, trie):
+        tree = cls()
+        for word in trie.iter_words():
+            tree.insert(word)
+        return tree
+
+    def fuzzy_search(self, word, max_distance=None, k=8):
+        """
+        Return the exact top-k (word, distance) pairs within max_distance (unbounded if None).
+        The radius shrinks to the current k-th best distance as matches are found.
+        Ties keep insertion order, matching a full scan sorted by distance.
+        """
+        if k <= 0 or self.root is None:
+            return []
+        best = []  # max-heap of (-distance, -order, word)
+
+        def radius():
+            if len(best) < k:
+                return max_distance
+            if max_distance is None:
+                return -best[0][0]
+            return min(max_distance, -best[0][0])
+
+        stack = [self.root]
+        while stack:
+            node_word, order, children = stack.pop()
+            d = self.distance(word, node_word)
+            limit = radius()
+            if limit is None or d <= limit:
+                entry = (-d, -order, node_word)
+                if len(best) < k:
+                    heapq.heappush(best, entry)
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+                limit = radius()
+            # Push the closest edges last so they are explored first and tighten the radius early
+            for edge in sorted(children, key=lambda e: abs(e - d), reverse=True):
+                if limit is None or d - limit <= edge <= d + limit:
+                    stack.append(children[edge])
+
+        return [(found, -neg_distance) for neg_distance, _, found in sorted(best, reverse=True)]
@@ -0,0 +1,56 @@
+from trie import Trie
+from suffix_trie import compile_suffixes
+
+
+class CategoryIndex:
+    """
+    One suggestion index per paradigm category next to the full index. A root followed by a
+    suffix is only searched among the roots whose category licenses that suffix, so the search
+    space shrinks and no suggestion pairs a root with a suffix it can never take. Roots without
+    a suffix, or suffixes no indexed category licenses, go to the full index.
+    """
+    def __init__(self, full_index, sub_indexes, paradigm_tables):
+        self.full_index = full_index
+        self.sub_indexes = sub_indexes  # category -> index with fuzzy_search
+        self.suffixes = compile_suffixes(paradigm_tables)
+        self.version = getattr(full_index, "version", None)
+
+    @classmethod
+    def from_sub_dictionaries(cls, sub_dictionaries, paradigm_tables, full_index, make_index=None):
+        """ Build a Trie per category that has a paradigm; make_index(trie) may wrap it in another engine. """
+        sub_indexes = {}
+        for category, words in sub_dictionaries.items():
+            if category not in paradigm_tables:
+                continue
+            trie = Trie()
+            for word in words:
+                trie.insert(word, category)
+            sub_indexes[category] = make_index(trie) if make_index else trie
+        return cls(full_index, sub_indexes, paradigm_tables)
+
+    @classmethod
+    def from_trie(cls, trie, paradigm_tables, make_index=None):
+        sub_dictionaries = {}
+        for word, categories in trie.iter_with_categories():
+            for category in categories:
+                sub_dictionaries.setdefault(category, []).append(word)
+        return cls.from_sub_dictionaries(sub_dictionaries, paradigm_tables, trie, make_index)
+
+    def fuzzy_search(self, word, max_distance=None, k=8):
+        return self.full_index.fuzzy_search(word, max_distance=max_distance, k=k)
+
+    def fuzzy_search_licensed(self, root, suffix, max_distance=None, k=8):
+        """ Top-k (root, distance) pairs among the roots that can take the suffix. """
+        indexes = [self.sub_indexes[category] for category in self.suffixes.categories(suffix)
+                   if category in self.sub_indexes] if suffix else []
+        if not indexes:
+            return self.fuzzy_search(root, max_distance=max_distance, k=k)
+        if len(indexes) == 1:
+            return indexes[0].fuzzy_search(root, max_distance=max_distance, k=k)
+        # A suffix shared by several paradigms: merge the per-category results by distance
+        best = {}
+        for index in indexes:
+            for match, distance in index.fuzzy_search(root, max_distance=max_distance, k=k):
+                if match not in best:
+                    best[match] = distance
+        return sorted(best.items(), key=lambda pair: pair[1])[:k]
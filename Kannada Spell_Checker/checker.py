@@ -0,0 +1,266 @@
+# checker.py
+# Spell checking and suggestion logic shared by the GUI (spellcheck.py), the tests and batch jobs.
+# Nothing here touches tkinter, so worker processes can import it.
+import heapq
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from trie import Trie
+from compact_trie import CompactTrie
+from dawg import load_dawg
+from Dictionary_load import iter_categorized_file, read_categorized_file
+from symspell import load_symspell_index
+from akshara import AksharaIndex
+from batch_levenshtein import BatchLevenshtein
+from ngram_index import NGramIndex
+from phonetic import PhoneticIndex
+from bktree import BKTree
+from suffix_trie import SuffixTrie, compile_suffixes
+from category_index import CategoryIndex
+from frequency import FrequencyIndex, load_frequencies
+
+paradigm_tables = {
+    "1": ["ತ್ತಿದ್ದಳು", "ತ್ತಿದ್ದನು", "ತ್ತಿದ್ದಾರೆ", "ತ್ತೀಯ", "ತ್ತಾರೆ"],
+    "2": ["ಗಳನ್ನು", "ಗಳಲ್ಲಿ", "ಗಳ"],
+    "3": ["ದ್ದನು", "ದ್ದಳು", "ದ್ದರು"],
+    "4": ["ದ", "ದಲ್ಲಿ", "ದಿಂದ"],
+     }
+# Compiled once; per-token checks take this instead of the tables so nothing is rebuilt per word
+paradigm_suffixes = SuffixTrie(paradigm_tables)
+
+
+def setup_trie(categorized_path="categorized.txt", compact=False, snapshot_path=None):
+    if snapshot_path:
+        # Map the compiled DAWG snapshot instead of parsing; it is recompiled if categorized.txt changed
+        return load_dawg(categorized_path, snapshot_path)
+    if compact:
+        # Array-backed trie: same API, a fraction of the memory
+        return CompactTrie.from_entries((word, category) for category, word in iter_categorized_file(categorized_path))
+    # Stream (category, word) pairs from the categorized file (text or binary) straight into the Trie
+    trie = Trie()
+    for category, word in iter_categorized_file(categorized_path):
+        trie.insert(word, category)
+    return trie
+
+def setup_suggestion_index(trie, engine="trie", categorized_path="categorized.txt", paradigm_tables=paradigm_tables):
+    # Every suggestion index exposes fuzzy_search(word, max_distance, k) like the Trie does
+    if engine == "symspell":
+        return load_symspell_index(categorized_path, "symspell_index.pkl")
+    if engine == "akshara":
+        return AksharaIndex.from_trie(trie)
+    if engine == "numpy":
+        return BatchLevenshtein.from_trie(trie)
+    if engine == "ngram":
+        return NGramIndex.from_trie(trie)
+    if engine == "bktree":
+        return BKTree.from_trie(trie)
+    if engine == "phonetic":
+        return PhoneticIndex.from_trie(trie)
+    if engine == "category":
+        return CategoryIndex.from_sub_dictionaries(read_categorized_file(categorized_path), paradigm_tables, trie)
+    if engine == "frequency":
+        return FrequencyIndex.from_trie(trie, "wiki.txt", "word_frequencies.txt")
+    return trie
+
+def prepare_suggestion_index(engine="trie", categorized_path="categorized.txt"):
+    # Build and save the on-disk index an engine reads, so worker processes only ever load it
+    if engine == "symspell":
+        load_symspell_index(categorized_path, "symspell_index.pkl")
+    if engine == "frequency":
+        load_frequencies("wiki.txt", "word_frequencies.txt", vocabulary=setup_trie(categorized_path))
+
+def if_not_kannada(word):
+    # Check each character to see if it is within the Kannada unicode range
+    for char in word:
+        if not ('\u0C80' <= char <= '\u0CFF'):
+            return False  # If any character is not Kannada, return False
+    return True  # If all characters are Kannada, return True
+
+def is_kannada_number(word):
+    kannada_numbers = ['೦', '೧', '೨', '೩', '೪', '೫', '೬', '೭', '೮', '೯']
+    return all(char in kannada_numbers for char in word)
+
+
+def process_misspelled_word(word, trie, paradigm_tables):
+    # Check if the whole word is valid
+    exists, _ = trie.search(word)
+    if exists:
+        return False  # Word is valid
+
+    # Root and suffix combinations are valid only when one of the root's categories licenses the suffix
+    suffixes = paradigm_tables if isinstance(paradigm_tables, SuffixTrie) else compile_suffixes(paradigm_tables)
+    for suffix, suffix_categories in suffixes.matches(word, min_root=1):
+        exists, categories = trie.search(word[:-len(suffix)])
+        if exists and not categories.isdisjoint(suffix_categories):
+            return False
+
+    # Word is misspelled
+    return True
+
+
+# Function to find a suffix from the word
+def find_suffix(word, paradigm_tables):
+    # Longest matching suffix; pass a compiled SuffixTrie (e.g. paradigm_suffixes) on hot paths
+    suffixes = paradigm_tables if isinstance(paradigm_tables, SuffixTrie) else compile_suffixes(paradigm_tables)
+    return suffixes.longest_match(word)
+
+# Generate similar words based on similarity to the root
+def generate_similar_words(root, trie, max_suggestions=8, suffix=''):
+    # Walk the trie with a bounded Levenshtein DP instead of scoring every dictionary word
+    if suffix and hasattr(trie, "fuzzy_search_licensed"):
+        # Only roots whose category takes this suffix
+        similar_words_with_distances = trie.fuzzy_search_licensed(root, suffix, k=max_suggestions)
+    else:
+        similar_words_with_distances = trie.fuzzy_search(root, k=max_suggestions)
+    return [word for word, _ in similar_words_with_distances]
+
+
+#####################Testing#############################
+def generate_suggestions_for_word(word, trie, paradigm_tables, cache=None):
+    try:
+        root_word, suffix = analyze_word(word, paradigm_tables)
+        key = (root_word, suffix, 8)
+        if cache is not None:
+            cache.bind(trie)
+            cached = cache.get(key)
+            if cached is not None:
+                return list(cached)
+        similar_roots = generate_similar_words(root_word, trie, max_suggestions=8, suffix=suffix)
+        suggestions = [similar_root + suffix for similar_root in similar_roots] if suffix else similar_roots
+        if cache is not None:
+            cache.put(key, tuple(suggestions))
+        return suggestions
+    except Exception as e:
+        print(f"Error in generate_suggestions_for_word: {e}")
+        return []
+
+def generate_suggestions_for_words(words, trie, paradigm_tables, max_suggestions=8, cache=None):
+    analyses = [analyze_word(word, paradigm_tables) for word in words]
+    results = [None] * len(words)
+    if cache is not None:
+        cache.bind(trie)
+        for i, (root_word, suffix) in enumerate(analyses):
+            cached = cache.get((root_word, suffix, max_suggestions))
+            if cached is not None:
+                results[i] = list(cached)
+
+    # Only the cache misses go to the engine, in one batch when it supports it
+    pending = [i for i, result in enumerate(results) if result is None]
+    roots = [analyses[i][0] for i in pending]
+    if hasattr(trie, "fuzzy_search_licensed"):
+        matches = [trie.fuzzy_search_licensed(*analyses[i], k=max_suggestions) for i in pending]
+    elif hasattr(trie, "fuzzy_search_many"):
+        matches = trie.fuzzy_search_many(roots, k=max_suggestions)
+    else:
+        matches = [trie.fuzzy_search(root_word, k=max_suggestions) for root_word in roots]
+    for i, found in zip(pending, matches):
+        root_word, suffix = analyses[i]
+        results[i] = [similar_root + suffix for similar_root, _ in found]
+        if cache is not None:
+            cache.put((root_word, suffix, max_suggestions), tuple(results[i]))
+    return results
+
+def analyze_word(word, paradigm_tables):
+    suffix = find_suffix(word, paradigm_tables)
+    root_word = word[:-len(suffix)] if suffix else word
+    return root_word, suffix
+
+
+#####################Parallel suggestions#############################
+# Per-process state, filled once by _init_worker so the dictionary is never pickled per call
+_worker = {}
+# Engines ranking by (distance, get_all_words position) alone, so shard results merge like one search
+DICTIONARY_SHARD_ENGINES = ("trie", "numpy", "ngram", "bktree")
+
+def _init_worker(categorized_path, engine, paradigm_tables, shard="queries"):
+    trie = setup_trie(categorized_path)
+    _worker["trie"] = trie
+    _worker["engine"] = engine
+    _worker["categorized_path"] = categorized_path
+    _worker["paradigm_tables"] = paradigm_tables
+    # Dictionary sharding only searches the shard indexes, so the full one is never built
+    _worker["index"] = setup_suggestion_index(trie, engine, categorized_path) if shard == "queries" else None
+    _worker["shards"] = {}
+
+def _suggest_chunk(words, max_suggestions):
+    return generate_suggestions_for_words(words, _worker["index"], _worker["paradigm_tables"], max_suggestions)
+
+def _shard_index(shard_id, shard_count):
+    # Every shard keeps global get_all_words order, so (distance, position) merges like a full scan
+    key = (shard_id, shard_count)
+    if key not in _worker["shards"]:
+        words = _worker["trie"].get_all_words()
+        shard_trie = Trie()
+        for position in range(shard_id, len(words), shard_count):
+            shard_trie.insert(words[position])
+        positions = {word: position for position, word in enumerate(words)}
+        index = setup_suggestion_index(shard_trie, _worker["engine"], _worker["categorized_path"])
+        _worker["shards"][key] = (index, positions)
+    return _worker["shards"][key]
+
+def _search_shard(shard_id, shard_count, roots, max_suggestions):
+    index, positions = _shard_index(shard_id, shard_count)
+    return [
+        [(distance, positions[word], word) for word, distance in index.fuzzy_search(root_word, k=max_suggestions)]
+        for root_word in roots
+    ]
+
+def suggest_many(words, paradigm_tables=paradigm_tables, categorized_path="categorized.txt", engine="trie",
+                 max_suggestions=8, workers=None, shard="queries"):
+    """
+    Suggestions for many words across a process pool; returns one list per input word.
+    shard="queries" splits the words between workers, each holding the whole dictionary.
+    shard="dictionary" gives every worker a slice of the dictionary and merges the top-k.
+    Dictionary sharding only supports the DICTIONARY_SHARD_ENGINES, whose top k merges into
+    the single-process ranking; the others rank by more than distance and dictionary order.
+    Persisted indexes (symspell, the frequency counts) are built once here, before the pool starts.
+    On Windows, call this from under an `if __name__ == "__main__":` guard.
+    """
+    if shard == "dictionary" and engine not in DICTIONARY_SHARD_ENGINES:
+        raise ValueError(f"The {engine} engine cannot shard the dictionary; use shard=\"queries\"")
+    unique_words = list(dict.fromkeys(words))
+    if not unique_words:
+        return [[] for _ in words]
+    workers = workers or os.cpu_count() or 1
+    # Compile the suffixes once here; the workers receive the compiled trie
+    suffixes = paradigm_tables if isinstance(paradigm_tables, SuffixTrie) else SuffixTrie(paradigm_tables)
+    init_args = (categorized_path, engine, suffixes, shard)
+    prepare_suggestion_index(engine, categorized_path)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=init_args) as executor:
+        if shard == "dictionary":
+            analyses = [analyze_word(word, suffixes) for word in unique_words]
+            roots = [root_word for root_word, _ in analyses]
+            futures = [executor.submit(_search_shard, shard_id, workers, roots, max_suggestions)
+                       for shard_id in range(workers)]
+            shard_results = [future.result() for future in futures]
+            suggestions = []
+            for i, (_, suffix) in enumerate(analyses):
+                merged = heapq.nsmallest(max_suggestions, (match for result in shard_results for match in result[i]))
+                suggestions.append([similar_root + suffix for _, _, similar_root in merged])
+        else:
+            chunk_size = max(1, -(-len(unique_words) // (workers * 4)))
+            chunks = [unique_words[i:i + chunk_size] for i in range(0, len(unique_words), chunk_size)]
+            suggestions = [s for chunk in executor.map(_suggest_chunk, chunks, [max_suggestions] * len(chunks))
+                           for s in chunk]
+
+    by_word = dict(zip(unique_words, suggestions))
+    return [by_word[word] for word in words]
+
+
+def main(document_path, categorized_path="categorized.txt"):
+    # Batch proofreading: report suggestions for every misspelled Kannada word in a text file
+    trie = setup_trie(categorized_path)
+    with open(document_path, "r", encoding="utf-8") as file:
+        words = [word for line in file for word in line.split()]
+    misspelled = [
+        word for word in dict.fromkeys(words)
+        if if_not_kannada(word) and not is_kannada_number(word)
+        and process_misspelled_word(word, trie, paradigm_suffixes)
+    ]
+    for word, suggestions in zip(misspelled, suggest_many(misspelled, categorized_path=categorized_path)):
+        print(f"{word}: {', '.join(suggestions)}")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:3])
@@ -0,0 +1,221 @@
+import sys
+import time
+import tracemalloc
+from array import array
+from bisect import bisect_left
+from collections import deque
+from trie import Trie, bounded_fuzzy_search, fuzzy_search_dictionary, iter_terminals
+from Dictionary_load import iter_categorized_file
+
+
+class CompactTrie:
+    """
+    Drop-in replacement for Trie stored as parallel arrays instead of one Python object per node.
+    Nodes are numbered breadth-first so every node's children are contiguous and sorted by
+    edge label: node i has children first_child[i] .. first_child[i] + child_count[i] - 1, and
+    labels[j] is the code point on the edge into node j. Each distinct set of categories is
+    interned once and nodes hold its small ID (0 is the empty set). That is about 13 bytes per
+    node against several hundred for a TrieNode.
+
+    The arrays are immutable once built, so insert() queues words and the arrays are rebuilt
+    on the next query; load in bulk with from_entries or from_trie for best results.
+    """
+    def __init__(self):
+        self.version = 0
+        self.category_sets = [frozenset()]
+        self._category_set_ids = {frozenset(): 0}
+        self._pending = {}
+        self._build([])
+
+    @classmethod
+    def from_entries(cls, entries):
+        """ Build from (word, category) pairs; a repeated word collects all its categories like Trie.insert. """
+        words = {}
+        for word, category in entries:
+            categories = words.setdefault(word, set())
+            if category is not None:
+                categories.add(category)
+        trie = cls()
+        trie._build(words.items())
+        return trie
+
+    @classmethod
+    def from_trie(cls, trie):
+        compact = cls()
+        compact._build(trie.iter_with_categories())
+        return compact
+
+    def _category_set_id(self, categories):
+        categories = frozenset(categories)
+        set_id = self._category_set_ids.get(categories)
+        if set_id is None:
+            set_id = self._category_set_ids[categories] = len(self.category_sets)
+            self.category_sets.append(categories)
+        return set_id
+
+    def _build(self, entries):
+        # entries are (word, categories) pairs with distinct words
+        entries = sorted(entries, key=lambda entry: entry[0])
+        self.labels = array('I', [0])
+        self.first_child = array('I', [0])
+        self.child_count = array('H', [0])
+        self.terminal = bytearray(1)
+        self.category = array('H', [0])
+
+        # Each queue item is a node and the slice of sorted entries sharing its prefix
+        queue = deque([(0, 0, len(entries), 0)])
+        while queue:
+            node, lo, hi, depth = queue.popleft()
+            if lo < hi and len(entries[lo][0]) == depth:
+                self.terminal[node] = 1
+                self.category[node] = self._category_set_id(entries[lo][1])
+                lo += 1
+            self.first_child[node] = len(self.labels)
+            count = 0
+            while lo < hi:
+                char = entries[lo][0][depth]
+                end = lo + 1
+                while end < hi and entries[end][0][depth] == char:
+                    end += 1
+                child = len(self.labels)
+                self.labels.append(ord(char))
+                self.first_child.append(0)
+                self.child_count.append(0)
+                self.terminal.append(0)
+                self.category.append(0)
+                queue.append((child, lo, end, depth + 1))
+                lo = end
+                count += 1
+            self.child_count[node] = count
+
+    def _flush(self):
+        if self._pending:
+            entries = dict(self._iter_entries(0, ''))
+            for word, categories in self._pending.items():
+                entries[word] = entries.get(word, frozenset()) | categories
+            self._pending = {}
+            self._build(entries.items())
+
+    def _child(self, node, char):
+        lo = self.first_child[node]
+        hi = lo + self.child_count[node]
+        code = ord(char)
+        i = bisect_left(self.labels, code, lo, hi)
+        if i < hi and self.labels[i] == code:
+            return i
+        return None
+
+    def _children(self, node):
+        first = self.first_child[node]
+        for child in range(first, first + self.child_count[node]):
+            yield chr(self.labels[child]), child
+
+    def _iter_entries(self, node, prefix):
+        for word, end in iter_terminals(node, self._children, self.terminal.__getitem__, prefix):
+            yield word, self.category_sets[self.category[end]]
+
+    def _find(self, prefix):
+        node = 0
+        for char in prefix:
+            node = self._child(node, char)
+            if node is None:
+                return None
+        return node
+
+    def insert(self, word, category=None):
+        self.version += 1
+        categories = self._pending.setdefault(word, set())
+        if category is not None:
+            categories.add(category)
+
+    def search(self, word):
+        self._flush()
+        node = 0
+        for char in word:
+            node = self._child(node, char)
+            if node is None:
+                return False, frozenset()
+        return bool(self.terminal[node]), self.category_sets[self.category[node]]
+
+    def iter_with_categories(self, prefix=''):
+        self._flush()
+        node = self._find(prefix)
+        return self._iter_entries(node, prefix) if node is not None else iter(())
+
+    def iter_words(self, prefix=''):
+        return (word for word, _ in self.iter_with_categories(prefix))
+
+    def count(self, prefix=''):
+        self._flush()
+        node = self._find(prefix)
+        total = 0
+        stack = [node] if node is not None else []
+        while stack:
+            node = stack.pop()
+            total += self.terminal[node]
+            first = self.first_child[node]
+            stack.extend(range(first, first + self.child_count[node]))
+        return total
+
+    def get_all_words(self, prefix=''):
+        return list(self.iter_words(prefix))
+
+    def get_all_words_with_categories(self, prefix=''):
+        return list(self.iter_with_categories(prefix))
+
+    def fuzzy_search(self, word, max_distance=None, k=8):
+        self._flush()
+        return fuzzy_search_dictionary(
+            lambda radius: bounded_fuzzy_search(0, self._children, self.terminal.__getitem__, word, radius, k),
+            word, max_distance, k,
+        )
+
+    #Check for words with invalid suffix:
+    def get_longest_valid_root(self, word):
+        self._flush()
+        node = 0
+        valid_root = ""
+        for i, char in enumerate(word):
+            node = self._child(node, char)
+            if node is None:
+                break
+            if self.terminal[node]:
+                valid_root = word[:i+1]
+        return valid_root
+
+    def node_count(self):
+        self._flush()
+        return len(self.labels)
+
+
+def measure_memory(categorized_path="categorized.txt"):
+    """ Peak traced allocation of the pointer-based Trie versus the CompactTrie for one dictionary. """
+    entries = [(word, category) for category, word in iter_categorized_file(categorized_path)]
+
+    tracemalloc.start()
+    start_time = time.time()
+    trie = Trie()
+    for word, category in entries:
+        trie.insert(word, category)
+    trie_bytes = tracemalloc.get_traced_memory()[0]
+    trie_time = time.time() - start_time
+    del trie
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    start_time = time.time()
+    compact = CompactTrie.from_entries(entries)
+    compact_time = time.time() - start_time
+    compact_bytes = tracemalloc.get_traced_memory()[0]
+    nodes = compact.node_count()
+    del compact
+    tracemalloc.stop()
+
+    print(f"{len(entries)} words, {nodes} nodes")
+    print(f"Trie:        {trie_bytes / 2**20:8.2f} MiB ({trie_bytes / nodes:6.1f} bytes/node), built in {trie_time:.2f}s")
+    print(f"CompactTrie: {compact_bytes / 2**20:8.2f} MiB ({compact_bytes / nodes:6.1f} bytes/node), built in {compact_time:.2f}s")
+    print(f"Reduction:   {trie_bytes / compact_bytes:.1f}x")
+
+
+if __name__ == "__main__":
+    measure_memory(*sys.argv[1:2])
@@ -0,0 +1,260 @@
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from collections import deque
+from trie import bounded_fuzzy_search, fuzzy_search_dictionary, iter_terminals
+from Dictionary_load import atomic_output, iter_categorized_file, source_stamp
+
+MAGIC = b'KNDAWG\x00\x00'
+FORMAT_VERSION = 2  # 2: final states carry a set of categories
+BYTE_ORDER_MARK = 0x01020304  # Written in native order; reads back differently on a foreign host
+# magic, version, byte-order mark, node count, edge count, category-set bytes, source size, source mtime
+HEADER = struct.Struct('=8sIIIIIqq')
+
+
+def build_dawg(entries):
+    """
+    Minimized acyclic automaton of the (word, category) pairs, built incrementally over sorted
+    words (Daciuk et al.): once a word's suffix path is final, each state is merged with an
+    already registered equivalent state. A word listed under several categories gets all of
+    them; a final state's category set is part of its identity, so only suffixes that end in
+    the same set are shared.
+    Returns (finals, edges, category_sets): finals[state] is 0 for a non-final state or 1 + the
+    index into category_sets, edges[state] maps char -> state. State 0 is the start state.
+    """
+    words = {}
+    for word, category in entries:
+        categories = words.setdefault(word, set())
+        if category is not None:
+            categories.add(category)
+    category_sets = {}
+    finals = [0]
+    edges = [{}]
+    register = {}
+    unchecked = []  # (parent, char, child) along the previous word's path still open to merging
+
+    def minimize(down_to):
+        while len(unchecked) > down_to:
+            parent, char, child = unchecked.pop()
+            signature = (finals[child], tuple(sorted(edges[child].items())))
+            existing = register.get(signature)
+            if existing is None:
+                register[signature] = child
+            else:
+                edges[parent][char] = existing
+
+    previous = ''
+    for word, categories in sorted(words.items()):
+        common = 0
+        while common < min(len(word), len(previous)) and word[common] == previous[common]:
+            common += 1
+        minimize(common)
+        state = unchecked[-1][2] if unchecked else 0
+        for char in word[common:]:
+            finals.append(0)
+            edges.append({})
+            edges[state][char] = len(edges) - 1
+            unchecked.append((state, char, len(edges) - 1))
+            state = len(edges) - 1
+        finals[state] = 1 + category_sets.setdefault(frozenset(categories), len(category_sets))
+        previous = word
+    minimize(0)
+    return finals, edges, sorted(category_sets, key=category_sets.get)
+
+
+def write_dawg(file_path, entries, source_stamp=(0, 0)):
+    """ Compile the entries and write the flat snapshot: header, node arrays, edge arrays, category sets. """
+    finals, edges, category_sets = build_dawg(entries)
+
+    # Renumber reachable states breadth-first; merged-away states are dropped
+    order = {0: 0}
+    queue = deque([0])
+    while queue:
+        for _, child in sorted(edges[queue.popleft()].items()):
+            if child not in order:
+                order[child] = len(order)
+                queue.append(child)
+    states = sorted(order, key=order.get)
+
+    first_edge = array('I', [0])
+    final = array('I')
+    labels = array('I')
+    targets = array('I')
+    for state in states:
+        for char, child in sorted(edges[state].items()):
+            labels.append(ord(char))
+            targets.append(order[child])
+        first_edge.append(len(labels))
+        final.append(finals[state])
+
+    # One line per category set, names separated by tabs; the empty set is an empty line
+    names = '\n'.join('\t'.join(sorted(categories)) for categories in category_sets).encode('utf-8')
+    with open(file_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, BYTE_ORDER_MARK, len(states), len(labels),
+                            len(names), *source_stamp))
+        for block in (first_edge, final, labels, targets):
+            block.tofile(f)
+        f.write(names)
+    return len(states), len(labels)
+
+
+class DawgDictionary:
+    """
+    Read-only Trie replacement that queries a snapshot written by write_dawg in place.
+    The file is mapped, not parsed: the node and edge arrays are memoryviews over the mapping,
+    so opening is O(1) and processes opening the same file share one page-cache copy.
+    """
+    def __init__(self, file_path):
+        with open(file_path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (magic, format_version, byte_order_mark, node_count, edge_count, names_length,
+             *source_stamp) = HEADER.unpack_from(self._map)
+            if magic != MAGIC or format_version != FORMAT_VERSION or byte_order_mark != BYTE_ORDER_MARK:
+                raise ValueError(f"{file_path} is not a version {FORMAT_VERSION} dictionary snapshot for this host")
+            self.source_stamp = tuple(source_stamp)
+            word_count = 2 * node_count + 1 + 2 * edge_count
+            self._words = memoryview(self._map)[HEADER.size:HEADER.size + 4 * word_count].cast('I')
+            self.first_edge = self._words[:node_count + 1]
+            self.final = self._words[node_count + 1:2 * node_count + 1]
+            self.labels = self._words[2 * node_count + 1:2 * node_count + 1 + edge_count]
+            self.targets = self._words[2 * node_count + 1 + edge_count:]
+            names_start = HEADER.size + 4 * word_count
+            names = self._map[names_start:names_start + names_length].decode('utf-8').split('\n')
+        except (ValueError, TypeError, struct.error):
+            self.close()
+            raise
+        # Set ID 0 is reserved for non-final states
+        self.category_sets = [frozenset()] + [frozenset(filter(None, line.split('\t'))) for line in names]
+        self.version = 0
+
+    def close(self):
+        for name in ('first_edge', 'final', 'labels', 'targets', '_words'):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+        self._map.close()
+
+    def _child(self, state, char):
+        lo = self.first_edge[state]
+        hi = self.first_edge[state + 1]
+        code = ord(char)
+        i = bisect_left(self.labels, code, lo, hi)
+        if i < hi and self.labels[i] == code:
+            return self.targets[i]
+        return None
+
+    def _children(self, state):
+        for i in range(self.first_edge[state], self.first_edge[state + 1]):
+            yield chr(self.labels[i]), self.targets[i]
+
+    def _is_final(self, state):
+        return self.final[state] != 0
+
+    def insert(self, word, category=None):
+        raise TypeError("a DAWG snapshot is read-only; rebuild it with write_dawg")
+
+    def search(self, word):
+        state = 0
+        for char in word:
+            state = self._child(state, char)
+            if state is None:
+                return False, frozenset()
+        return self.final[state] != 0, self.category_sets[self.final[state]]
+
+    def _find(self, prefix):
+        state = 0
+        for char in prefix:
+            state = self._child(state, char)
+            if state is None:
+                return None
+        return state
+
+    def iter_with_categories(self, prefix=''):
+        state = self._find(prefix)
+        if state is None:
+            return
+        for word, end in iter_terminals(state, self._children, self._is_final, prefix):
+            yield word, self.category_sets[self.final[end]]
+
+    def iter_words(self, prefix=''):
+        return (word for word, _ in self.iter_with_categories(prefix))
+
+    def count(self, prefix=''):
+        # States are shared, so count paths: words below a state, memoized per state
+        start = self._find(prefix)
+        if start is None:
+            return 0
+        counts = {}
+        stack = [start]
+        while stack:
+            state = stack[-1]
+            pending = [child for _, child in self._children(state) if child not in counts]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            counts[state] = (self.final[state] != 0) + sum(counts[child] for _, child in self._children(state))
+        return counts[start]
+
+    def get_all_words(self, prefix=''):
+        return list(self.iter_words(prefix))
+
+    def get_all_words_with_categories(self, prefix=''):
+        return list(self.iter_with_categories(prefix))
+
+    def fuzzy_search(self, word, max_distance=None, k=8):
+        return fuzzy_search_dictionary(
+            lambda radius: bounded_fuzzy_search(0, self._children, self._is_final, word, radius, k),
+            word, max_distance, k,
+        )
+
+    #Check for words with invalid suffix:
+    def get_longest_valid_root(self, word):
+        state = 0
+        valid_root = ""
+        for i, char in enumerate(word):
+            state = self._child(state, char)
+            if state is None:
+                break
+            if self.final[state]:
+                valid_root = word[:i+1]
+        return valid_root
+
+
+def compile_dictionary(categorized_path="categorized.txt", dawg_path="dictionary.dawg"):
+    """ The build step: categorized.txt -> minimized snapshot. Written to a unique temporary file and renamed into place. """
+    entries = [(word, category) for category, word in iter_categorized_file(categorized_path)]
+    with atomic_output(dawg_path) as temp_path:
+        return write_dawg(temp_path, entries, source_stamp(categorized_path))
+
+
+def load_dawg(categorized_path="categorized.txt", dawg_path="dictionary.dawg"):
+    """ Map the snapshot, compiling it first when it is missing, unreadable or older than the categorized file. """
+    stamp = source_stamp(categorized_path)
+    if os.path.exists(dawg_path):
+        try:
+            dawg = DawgDictionary(dawg_path)
+            if dawg.source_stamp == stamp:
+                return dawg
+            dawg.close()
+        except (ValueError, TypeError, struct.error):
+            pass
+    compile_dictionary(categorized_path, dawg_path)
+    return DawgDictionary(dawg_path)
+
+
+if __name__ == "__main__":
+    categorized_path = sys.argv[1] if len(sys.argv) > 1 else "categorized.txt"
+    dawg_path = sys.argv[2] if len(sys.argv) > 2 else "dictionary.dawg"
+    start_time = time.time()
+    states, edge_count = compile_dictionary(categorized_path, dawg_path)
+    print(f"Compiled {categorized_path} to {dawg_path}: {states} states, {edge_count} edges, "
+          f"{os.path.getsize(dawg_path)} bytes in {time.time() - start_time:.2f} seconds.")
+    start_time = time.perf_counter()
+    DawgDictionary(dawg_path).close()
+    print(f"Opened in {(time.perf_counter() - start_time) * 1000:.2f} ms.")
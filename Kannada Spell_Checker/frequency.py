@@ -0,0 +1,153 @@
+import os
+import sys
+import time
+from collections import Counter
+from compact_trie import CompactTrie
+from Dictionary_load import atomic_output, source_stamp
+
+
+def count_frequencies(corpus_paths, vocabulary=None, batch_lines=100000):
+    """
+    Stream the corpus line by line and count every token. With a vocabulary (any dictionary
+    with search), only its words are kept; each batch checks its distinct tokens once, so
+    memory stays bounded by the vocabulary rather than by the corpus.
+    """
+    counts = Counter()
+    for corpus_path in corpus_paths:
+        with open(corpus_path, "r", encoding="utf-8", errors="replace") as corpus:
+            batch = Counter()
+            for line_number, line in enumerate(corpus, 1):
+                batch.update(line.split())
+                if line_number % batch_lines == 0:
+                    _add_batch(counts, batch, vocabulary)
+                    batch = Counter()
+            _add_batch(counts, batch, vocabulary)
+    return counts
+
+
+def _add_batch(counts, batch, vocabulary):
+    for word, count in batch.items():
+        if word in counts or vocabulary is None or vocabulary.search(word)[0]:
+            counts[word] += count
+
+
+class WordFrequencies:
+    """ Corpus counts of dictionary words, saved next to the dictionary as "word<TAB>count" lines, most frequent first. """
+    def __init__(self, counts=None, source_stamp=None):
+        self.counts = dict(counts or {})
+        self.source_stamp = source_stamp
+
+    def count(self, word):
+        return self.counts.get(word, 0)
+
+    def most_common(self):
+        return sorted(self.counts.items(), key=lambda pair: (-pair[1], pair[0]))
+
+    def save(self, file_path):
+        with atomic_output(file_path) as temp_path, open(temp_path, "w", encoding="utf-8") as f:
+            f.write("#source\t" + "\t".join(map(str, self.source_stamp or ())) + "\n")
+            for word, count in self.most_common():
+                f.write(f"{word}\t{count}\n")
+
+    @classmethod
+    def load(cls, file_path):
+        frequencies = cls()
+        with open(file_path, "r", encoding="utf-8") as f:
+            header = f.readline().rstrip("\n").split("\t")
+            if header[0] != "#source":
+                raise ValueError(f"{file_path} is not a word frequency file")
+            frequencies.source_stamp = tuple(map(int, header[1:])) or None
+            for line in f:
+                word, count = line.rstrip("\n").split("\t")
+                frequencies.counts[word] = int(count)
+        return frequencies
+
+
+def load_frequencies(corpus_path="wiki.txt", frequency_path="word_frequencies.txt", vocabulary=None):
+    """
+    Reload the saved counts, recounting and saving them when the corpus changed since they
+    were made. Without a corpus the saved counts are used as they are, or none at all.
+    """
+    if not os.path.exists(corpus_path):
+        return WordFrequencies.load(frequency_path) if os.path.exists(frequency_path) else WordFrequencies()
+    stamp = source_stamp(corpus_path)
+    if os.path.exists(frequency_path):
+        try:
+            frequencies = WordFrequencies.load(frequency_path)
+            if frequencies.source_stamp == stamp:
+                return frequencies
+        except ValueError:
+            pass
+
+    frequencies = WordFrequencies(count_frequencies([corpus_path], vocabulary), stamp)
+    frequencies.save(frequency_path)
+    return frequencies
+
+
+class FrequencyIndex:
+    """
+    Suggestion search in frequency tiers: the most frequent dictionary words are searched
+    first, in small tries of growing size, within tier_distance edits. The search stops as
+    soon as k candidates sit at the smallest possible distance (0 for a dictionary word,
+    1 otherwise). Before that, later tiers and the full dictionary are only searched up to
+    the current k-th distance, and the dictionary fills the result to k.
+    Distance always ranks first; equal distances are ranked by corpus frequency, and words
+    the corpus never saw keep the dictionary's order, so without frequencies the results
+    match the dictionary's own search.
+    """
+    def __init__(self, dictionary, frequencies, tier_sizes=(1000, 10000), tier_distance=2):
+        self.dictionary = dictionary
+        self.frequencies = frequencies
+        self.tier_distance = tier_distance  # A typo radius; farther words are left to the full search
+        self.version = getattr(dictionary, "version", None)
+        ranked = [word for word, _ in frequencies.most_common() if dictionary.search(word)[0]]
+        # Tiers pay off only while they are much smaller than the dictionary; a tier holding
+        # most of it costs as much to search as the dictionary itself
+        self.tiers = []
+        start = 0
+        for end in tier_sizes:
+            if start >= len(ranked):
+                break
+            self.tiers.append(CompactTrie.from_entries((word, None) for word in ranked[start:end]))
+            start = end
+
+    @classmethod
+    def from_trie(cls, trie, corpus_path="wiki.txt", frequency_path="word_frequencies.txt"):
+        return cls(trie, load_frequencies(corpus_path, frequency_path, vocabulary=trie))
+
+    def rank(self, found, k):
+        # Stable sort: within a distance, earlier tiers and then dictionary order stay ahead
+        found.sort(key=lambda pair: (pair[1], -self.frequencies.count(pair[0])))
+        del found[k:]
+
+    def fuzzy_search(self, word, max_distance=None, k=8):
+        if k <= 0:
+            return []
+        floor = 0 if self.dictionary.search(word)[0] else 1
+        found = []
+        limit = max_distance
+        for tier in self.tiers:
+            tier_limit = self.tier_distance if limit is None else min(limit, self.tier_distance)
+            found.extend(tier.fuzzy_search(word, max_distance=tier_limit, k=k))
+            self.rank(found, k)
+            if len(found) == k:
+                if found[-1][1] <= floor:
+                    return found
+                # Rarer words can still win, but only at or below the current k-th distance
+                limit = found[-1][1]
+        # The dictionary holds every tier word too, so duplicates are dropped
+        seen = {match for match, _ in found}
+        found.extend(pair for pair in self.dictionary.fuzzy_search(word, max_distance=limit, k=k) if pair[0] not in seen)
+        self.rank(found, k)
+        return found
+
+
+if __name__ == "__main__":
+    # Usage: python frequency.py [corpus categorized_file]
+    from checker import setup_trie
+    corpus_path = sys.argv[1] if len(sys.argv) > 1 else "wiki.txt"
+    start_time = time.time()
+    trie = setup_trie(sys.argv[2] if len(sys.argv) > 2 else "categorized.txt")
+    frequencies = load_frequencies(corpus_path, vocabulary=trie)
+    print(f"Counted {len(frequencies.counts)} dictionary words in {corpus_path} "
+          f"in {time.time() - start_time:.2f} seconds.")
@@ -0,0 +1,136 @@
+import hashlib
+import json
+import os
+import sys
+import time
+from Dictionary_load import (atomic_output, complex_suffixes, load_dictionary_words, categorize_words,
+                             write_categorized_results, read_categorized_file)
+from suffix_trie import SuffixTrie
+from dawg import compile_dictionary
+
+MANIFEST_VERSION = 1
+
+
+def file_hash(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def tables_hash(suffix_tables):
+    canonical = json.dumps(sorted((str(category), suffixes) for category, suffixes in suffix_tables.items()),
+                           ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def load_manifest(manifest_path):
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if manifest.get("version") == MANIFEST_VERSION else {}
+
+
+def save_manifest(manifest_path, manifest):
+    with atomic_output(manifest_path) as temp_path, open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(dict(manifest, version=MANIFEST_VERSION), f, indent=2)
+
+
+def apply_delta(categorized_roots, old_words, new_words, suffix_tables):
+    """
+    Update categorized_roots in place for a dictionary edit. Only roots that an added or
+    removed word could be a form of are re-checked, each against its full paradigm.
+    Returns the number of (category, root) memberships that changed.
+    """
+    suffixes = SuffixTrie(suffix_tables)
+    paradigms = {category: set(table) for category, table in suffix_tables.items()}
+    affected = set()
+    for word in (new_words - old_words) | (old_words - new_words):
+        for suffix, categories in suffixes.matches(word):
+            for category in categories:
+                affected.add((category, word[:-len(suffix)]))
+
+    changed = 0
+    for category, root in affected:
+        complete = all(root + suffix in new_words for suffix in paradigms[category])
+        roots = categorized_roots[category]
+        if complete and root not in roots:
+            roots.add(root)
+            changed += 1
+        elif not complete and root in roots:
+            roots.discard(root)
+            changed += 1
+    return changed
+
+
+def _write_words(file_path, words):
+    with atomic_output(file_path) as temp_path, open(temp_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(sorted(words)))
+
+
+def rebuild(dictionary_path="Final_dictionary.txt", categorized_path="categorized.txt",
+            snapshot_path="dictionary.dawg", manifest_path="build_manifest.json",
+            words_path="build_words.txt", suffix_tables=complex_suffixes):
+    """
+    Bring categorized.txt and the DAWG snapshot up to date with the dictionary.
+    The manifest records the hash of every stage's input and output. Nothing runs when all
+    of them match. A dictionary edit re-categorizes only the affected roots, starting from
+    the previous categorized.txt and the word list saved by the last build. A change to the
+    paradigm tables, or an output that no longer matches its recorded hash, triggers a full
+    rebuild of that stage.
+    Returns a short description of what was done.
+    """
+    manifest = load_manifest(manifest_path)
+    dictionary_hash = file_hash(dictionary_path)
+    paradigm_hash = tables_hash(suffix_tables)
+
+    categorized_current = (
+        manifest.get("paradigm_hash") == paradigm_hash
+        and os.path.exists(categorized_path) and manifest.get("categorized_hash") == file_hash(categorized_path)
+        and os.path.exists(words_path) and manifest.get("words_hash") == file_hash(words_path)
+    )
+    snapshot_current = (
+        os.path.exists(snapshot_path) and manifest.get("snapshot_hash") == file_hash(snapshot_path)
+    )
+    if categorized_current and manifest.get("dictionary_hash") == dictionary_hash and snapshot_current:
+        return "up to date"
+
+    if categorized_current and manifest.get("dictionary_hash") == dictionary_hash:
+        action = "snapshot recompiled"
+    else:
+        new_words = load_dictionary_words(dictionary_path)
+        if categorized_current:
+            old_words = load_dictionary_words(words_path)
+            sub_dictionaries = read_categorized_file(categorized_path)
+            categorized_roots = {category: set(sub_dictionaries.get(str(category), ())) for category in suffix_tables}
+            changed = apply_delta(categorized_roots, old_words, new_words, suffix_tables)
+            action = (f"{len(new_words - old_words)} words added, {len(old_words - new_words)} removed, "
+                      f"{changed} root memberships changed")
+        else:
+            categorized_roots, _ = categorize_words(new_words, suffix_tables)
+            action = "full rebuild"
+
+        all_categorized_words = {root + suffix for category, roots in categorized_roots.items()
+                                 for root in roots for suffix in suffix_tables[category]}
+        with atomic_output(categorized_path) as temp_path:
+            write_categorized_results(categorized_roots, all_categorized_words, new_words, temp_path)
+        _write_words(words_path, new_words)
+
+    # The minimized automaton is global, so the snapshot is recompiled from the patched file
+    compile_dictionary(categorized_path, snapshot_path)
+    save_manifest(manifest_path, {
+        "dictionary_hash": dictionary_hash,
+        "paradigm_hash": paradigm_hash,
+        "categorized_hash": file_hash(categorized_path),
+        "words_hash": file_hash(words_path),
+        "snapshot_hash": file_hash(snapshot_path),
+    })
+    return action
+
+
+if __name__ == "__main__":
+    start_time = time.time()
+    print(f"{rebuild(*sys.argv[1:2])} in {time.time() - start_time:.2f} seconds.")
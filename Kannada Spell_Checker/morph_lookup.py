@@ -0,0 +1,89 @@
+import random
+import sys
+import time
+import tracemalloc
+from trie import setup_trie_with_categories, setup_trie_with_full_forms
+from suffix_trie import SuffixTrie
+from Dictionary_load import read_categorized_file
+from checker import paradigm_tables
+
+
+class MorphLookup:
+    """
+    Answers the same questions as a trie built by setup_trie_with_full_forms without storing a
+    single expanded form: a word is valid if it is a root, or if it splits into a root plus a
+    suffix from that root's paradigm. Memory is roots + suffixes instead of roots x suffixes.
+    `roots` is anything with search(word) -> (exists, categories): Trie, CompactTrie or a DAWG.
+    """
+    def __init__(self, roots, paradigm_tables):
+        self.roots = roots
+        self.suffixes = SuffixTrie(paradigm_tables)
+
+    def analyze(self, word):
+        """
+        (root, suffix, categories) for the first valid split, longest suffix first, or None.
+        categories are the root's categories whose paradigm licenses the suffix.
+        """
+        exists, categories = self.roots.search(word)
+        if exists:
+            return word, '', categories
+        for suffix, suffix_categories in self.suffixes.matches(word, min_root=1):
+            root = word[:-len(suffix)]
+            exists, categories = self.roots.search(root)
+            licensed = categories.intersection(suffix_categories)
+            if exists and licensed:
+                return root, suffix, licensed
+        return None
+
+    def search(self, word):
+        analysis = self.analyze(word)
+        if analysis is None:
+            return False, frozenset()
+        return True, analysis[2]
+
+    def get_longest_valid_root(self, word):
+        return self.roots.get_longest_valid_root(word)
+
+
+def benchmark(categorized_path="categorized.txt", query_count=10000, seed=0):
+    """ Memory and lookup time of the materialised full-form trie against MorphLookup over a root trie. """
+    sub_dictionaries = read_categorized_file(categorized_path)
+
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    full_forms = setup_trie_with_full_forms(sub_dictionaries, paradigm_tables)
+    full_build = time.perf_counter() - start_time
+    full_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    morph = MorphLookup(setup_trie_with_categories(sub_dictionaries), paradigm_tables)
+    morph_build = time.perf_counter() - start_time
+    morph_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Half valid inflected forms, half the same forms with their last character dropped
+    rng = random.Random(seed)
+    forms = [root + suffix for category, roots in sub_dictionaries.items()
+             for root in roots for suffix in paradigm_tables.get(category, [])]
+    queries = rng.sample(forms, min(query_count // 2, len(forms)))
+    queries += [form[:-1] for form in queries]
+
+    timings = []
+    for lookup in (full_forms, morph):
+        start_time = time.perf_counter()
+        results = [lookup.search(query) for query in queries]
+        timings.append((time.perf_counter() - start_time, results))
+    agreement = sum(a[0] == b[0] for a, b in zip(timings[0][1], timings[1][1])) / len(queries) * 100
+
+    print(f"{sum(len(words) for words in sub_dictionaries.values())} roots, {len(forms)} inflected forms")
+    print(f"Full-form trie: {full_bytes / 2**20:8.2f} MiB, built in {full_build:.2f}s, "
+          f"{timings[0][0] / len(queries) * 1e6:.2f} us/lookup")
+    print(f"MorphLookup:    {morph_bytes / 2**20:8.2f} MiB, built in {morph_build:.2f}s, "
+          f"{timings[1][0] / len(queries) * 1e6:.2f} us/lookup")
+    print(f"Same validity verdict on {agreement:.1f}% of {len(queries)} lookups")
+
+
+if __name__ == "__main__":
+    benchmark(*sys.argv[1:2])
@@ -0,0 +1,77 @@
+import heapq
+from array import array
+import Levenshtein as lev
+
+PAD = '\x00'  # Boundary marker; never appears in a Kannada word
+
+
+class NGramIndex:
+    """
+    Inverted index from n-grams (of characters, or of aksharas with tokenize=split_aksharas)
+    to dictionary word IDs. A lookup first shortlists the words sharing enough n-grams with
+    the query to be within the search radius, then runs exact Levenshtein only on that shortlist.
+    """
+    def __init__(self, n=3, tokenize=list):
+        self.n = n
+        self.tokenize = tokenize
+        self.words = []
+        self.postings = {}
+
+    def grams(self, word):
+        tokens = [PAD] * (self.n - 1) + list(self.tokenize(word)) + [PAD] * (self.n - 1)
+        return {tuple(tokens[i:i + self.n]) for i in range(len(tokens) - self.n + 1)}
+
+    def insert(self, word):
+        word_id = len(self.words)
+        self.words.append(word)
+        for gram in self.grams(word):
+            posting = self.postings.get(gram)
+            if posting is None:
+                posting = self.postings[gram] = array('I')
+            posting.append(word_id)
+
+    @classmethod
+    def from_trie(cls, trie, n=3, tokenize=list):
+        index = cls(n, tokenize)
+        for word in trie.iter_words():
+            index.insert(word)
+        return index
+
+    def shared_counts(self, word):
+        """ Number of distinct n-grams each dictionary word shares with the query, by word ID. """
+        counts = {}
+        for gram in self.grams(word):
+            for word_id in self.postings.get(gram, ()):
+                counts[word_id] = counts.get(word_id, 0) + 1
+        return counts
+
+    def fuzzy_search(self, word, max_distance=None, k=8):
+        """
+        Exact top-k (word, distance) pairs within max_distance. The shortlist is every word
+        passing the q-gram count filter (an edit destroys at most n grams), so no match within
+        the radius is missed. Without max_distance the radius widens one edit at a time until
+        k words are found, or until the filter excludes nothing and all words are scored.
+        Ties keep insertion order, matching a full scan sorted by distance.
+        """
+        if k <= 0:
+            return []
+        query_grams = len(self.grams(word))
+        counts = self.shared_counts(word)
+        radius = 1 if max_distance is None else max_distance
+        while True:
+            threshold = query_grams - self.n * radius
+            if threshold <= 0:
+                # Too short for the filter to exclude anything: score every word
+                shortlist = range(len(self.words))
+                cutoff = max_distance
+            else:
+                shortlist = [word_id for word_id, shared in counts.items() if shared >= threshold]
+                cutoff = radius
+            scored = []
+            for word_id in shortlist:
+                distance = lev.distance(word, self.words[word_id], score_cutoff=cutoff)
+                if cutoff is None or distance <= cutoff:
+                    scored.append((distance, word_id))
+            if max_distance is not None or threshold <= 0 or len(scored) >= k:
+                return [(self.words[word_id], distance) for distance, word_id in heapq.nsmallest(k, scored)]
+            radius += 1
@@ -0,0 +1,90 @@
+import re
+import Levenshtein as lev
+
+# Character-level collapses applied before the nasal rule
+PHONETIC_MAP = str.maketrans({
+    # Aspirated -> unaspirated (the retroflex aspirates go straight to the dental stop)
+    'ಖ': 'ಕ', 'ಘ': 'ಗ', 'ಛ': 'ಚ', 'ಝ': 'ಜ', 'ಠ': 'ತ', 'ಢ': 'ದ', 'ಥ': 'ತ', 'ಧ': 'ದ', 'ಫ': 'ಪ', 'ಭ': 'ಬ',
+    # Retroflex -> dental, and the three sibilants to one
+    'ಟ': 'ತ', 'ಡ': 'ದ', 'ಣ': 'ನ', 'ಳ': 'ಲ', 'ೞ': 'ಲ', 'ಱ': 'ರ', 'ಷ': 'ಸ', 'ಶ': 'ಸ',
+    # Long -> short vowels and vowel signs; the long-a sign collapses onto the inherent vowel
+    'ಆ': 'ಅ', 'ಈ': 'ಇ', 'ಊ': 'ಉ', 'ೠ': 'ಋ', 'ಏ': 'ಎ', 'ಓ': 'ಒ',
+    'ಾ': None, 'ೀ': 'ಿ', 'ೂ': 'ು', 'ೄ': 'ೃ', 'ೇ': 'ೆ', 'ೋ': 'ೊ', 'ೕ': None,
+    # Candrabindu is a nasal like the anusvara; joiners carry no sound
+    'ಁ': 'ಂ', '\u200c': None, '\u200d': None,
+})
+# A nasal consonant with virama before another consonant is written interchangeably with anusvara
+NASAL_CLUSTER = re.compile('[ಙಞನಮ]್(?=[ಕ-ಹ])')
+
+
+def phonetic_key(word):
+    """
+    Map a Kannada word to a key shared by its common phonetic misspellings: aspirated/unaspirated
+    pairs, short/long vowels, retroflex/dental pairs and anusvara/nasal variants all collapse.
+    """
+    return NASAL_CLUSTER.sub('ಂ', word.translate(PHONETIC_MAP))
+
+
+def _single_deletes(key):
+    return {key[:i] + key[i + 1:] for i in range(len(key))}
+
+
+class PhoneticIndex:
+    """
+    key -> roots buckets built alongside the Trie. A lookup ranks the roots in the query's
+    bucket and its neighbouring buckets (keys within one deletion of each other) and only
+    falls back to the full search when that tier holds fewer than k suggestions.
+    """
+    def __init__(self, fallback=None):
+        self.fallback = fallback
+        self.words = []
+        self.buckets = {}
+        self.neighbours = {}  # key or single-deletion variant -> keys it belongs to
+
+    def insert(self, word):
+        key = phonetic_key(word)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = []
+            for variant in _single_deletes(key) | {key}:
+                self.neighbours.setdefault(variant, set()).add(key)
+        bucket.append(len(self.words))
+        self.words.append(word)
+
+    @classmethod
+    def from_trie(cls, trie):
+        index = cls(fallback=trie)
+        for word in trie.iter_words():
+            index.insert(word)
+        return index
+
+    def candidate_keys(self, word):
+        key = phonetic_key(word)
+        keys = set()
+        for variant in _single_deletes(key) | {key}:
+            keys |= self.neighbours.get(variant, set())
+        return keys
+
+    def phonetic_search(self, word, max_distance=None, k=8):
+        """ Top-k (word, distance) pairs from the phonetic buckets alone. """
+        scored = []
+        for key in self.candidate_keys(word):
+            for word_id in self.buckets[key]:
+                distance = lev.distance(word, self.words[word_id], score_cutoff=max_distance)
+                if max_distance is None or distance <= max_distance:
+                    scored.append((distance, word_id))
+        scored.sort()
+        return [(self.words[word_id], distance) for distance, word_id in scored[:k]]
+
+    def fuzzy_search(self, word, max_distance=None, k=8):
+        found = self.phonetic_search(word, max_distance, k)
+        if len(found) >= k or self.fallback is None:
+            return found
+        # Phonetic matches come first; the full search only fills the remaining slots
+        seen = {match for match, _ in found}
+        for match, distance in self.fallback.fuzzy_search(word, max_distance=max_distance, k=k):
+            if len(found) >= k:
+                break
+            if match not in seen:
+                found.append((match, distance))
+        return found
@@ -1,7 +1,9 @@
 # spellcheck.py 
-from trie import Trie  
-from Dictionary_load import read_categorized_file 
-import Levenshtein as lev
+from checker import (
+    setup_trie, setup_suggestion_index, if_not_kannada, is_kannada_number, process_misspelled_word,
+    generate_suggestions_for_word, generate_suggestions_for_words, paradigm_suffixes,
+)
+from suggestion_cache import SuggestionCache
 import tkinter as tk
 from tkinter import scrolledtext, messagebox, ttk
 import tkinter.font as tkFont
@@ -14,28 +16,14 @@ from functools import lru_cache
 
 
 ignored_words = set()  # Global set to store ignored words
-
-
-def setup_trie():
-    # Load sub-dictionaries from the categorized file
-    sub_dictionaries = read_categorized_file("categorized.txt")
-    # Initialize and populate the Trie
-    trie = Trie()
-    for category, words in sub_dictionaries.items():
-        for word in words:
-            trie.insert(word, category)
-    return trie
-
-def if_not_kannada(word):
-    # Check each character to see if it is within the Kannada unicode range
-    for char in word:
-        if not ('\u0C80' <= char <= '\u0CFF'):
-            return False  # If any character is not Kannada, return False
-    return True  # If all characters are Kannada, return True
-
-def is_kannada_number(word):
-    kannada_numbers = ['೦', '೧', '೨', '೩', '೪', '೫', '೬', '೭', '೮', '೯']
-    return all(char in kannada_numbers for char in word)
+SUGGESTION_ENGINE = "trie"  # "symspell": persisted deletion index, "akshara": akshara edit distance,
+                            # "numpy": vectorized batch Levenshtein over length buckets,
+                            # "ngram": trigram shortlist, then exact Levenshtein on the shortlist,
+                            # "bktree": BK-tree pruned by the triangle inequality,
+                            # "phonetic": phonetic-key buckets first, trie walk only to fill the rest,
+                            # "category": roots searched only in the categories that take the word's suffix
+                            # "frequency": frequent words (counted in wiki.txt) searched first, ties go to the more frequent
+suggestion_cache = SuggestionCache(maxsize=1024)  # (root, suffix, k) -> suggestions, LRU evicted
 
 
 def get_all_suffixes(paradigm_tables):
@@ -69,6 +57,7 @@ def spell_check():
 
     words = input_text.split()
     misspelled_count = 0
+    misspelled_words = []
 
     for word in words:
         if word in ignored_words:  # Skip ignored words
@@ -77,11 +66,17 @@ def spell_check():
         if not if_not_kannada(word) or is_kannada_number(word):
             continue
 
-        is_misspelled = process_misspelled_word(word, trie, paradigm_tables)
+        is_misspelled = process_misspelled_word(word, trie, paradigm_suffixes)
         if is_misspelled:
             mark_word_as_misspelled(word)
             misspelled_count += 1
-        
+            misspelled_words.append(word)
+
+    # Batch engines score every flagged word in one pass over the packed dictionary and fill the cache
+    if hasattr(suggestion_index, "fuzzy_search_many"):
+        unique_words = list(dict.fromkeys(misspelled_words))
+        generate_suggestions_for_words(unique_words, suggestion_index, paradigm_suffixes, cache=suggestion_cache)
+
     duration = time.time() - start_time
     status_var.set(f"Spell Check Complete. Time taken: {duration:.2f} seconds.")
     if misspelled_count > 0:
@@ -91,43 +86,6 @@ def spell_check():
     textbox.config(state=tk.NORMAL)
     textbox.focus_set()
 
-    
-def process_misspelled_word(word, trie, paradigm_tables):
-    # Check if the whole word is valid
-    exists, _ = trie.search(word)
-    if exists:
-        return False  # Word is valid
-
-    suffix = find_suffix(word, paradigm_tables)
-    root = word[:-len(suffix)] if suffix else word
-
-    # If root and suffix combination is valid, the word is not misspelled
-    if suffix and trie.search(root)[0]:
-        return False
-
-    # Word is misspelled
-    return True
-
-
-# Function to find a suffix from the word
-def find_suffix(word, paradigm_tables):
-    all_suffixes = [suffix for sublist in paradigm_tables.values() for suffix in sublist]
-    for suffix in all_suffixes:
-        if word.endswith(suffix):
-            return suffix
-    return ''
-
-# Generate similar words based on similarity to the root
-def generate_similar_words(root, trie, max_suggestions=8):
-    all_words = trie.get_all_words()
-    similar_words_with_distances = [
-        (word, lev.distance(root, word)) for word in all_words
-    ]
-    
-    similar_words_with_distances.sort(key=lambda x: x[1])
-    return [word for word, _ in similar_words_with_distances[:max_suggestions]]
-
-
 def display_suggestions(event):
     try:
         index = textbox.index(f"@{event.x},{event.y}")
@@ -137,12 +95,8 @@ def display_suggestions(event):
             if textbox.compare(start, "<=", index) and textbox.compare(index, "<=", end):
                 word = textbox.get(start, end)
 
-                suffix = find_suffix(word, paradigm_tables)
-                root_word = word[:-len(suffix)] if suffix else word
-
-                # Generate suggestions directly within the function
-                similar_roots = generate_similar_words(root_word, trie, max_suggestions=8)
-                suggestions = [similar_root + suffix for similar_root in similar_roots] if suffix else similar_roots
+                # Repeated right-clicks on the same misspelling are served from the LRU cache
+                suggestions = generate_suggestions_for_word(word, suggestion_index, paradigm_suffixes, cache=suggestion_cache)
 
                 suggestion_menu = tk.Menu(root, tearoff=0)  # Reference the main window correctly
                 suggestion_menu.add_command(label="Ignore word", command=lambda s=start, e=end: ignore_word(s, e))
@@ -161,22 +115,6 @@ def display_suggestions(event):
     except Exception as e:
         print(f"Error in display_suggestions: {e}")
 
-#####################Testing#############################
-def generate_suggestions_for_word(word, trie, paradigm_tables):
-    try:
-        root_word, suffix = analyze_word(word, paradigm_tables)
-        similar_roots = generate_similar_words(root_word, trie, max_suggestions=8)
-        suggestions = [similar_root + suffix for similar_root in similar_roots] if suffix else similar_roots
-        return suggestions
-    except Exception as e:
-        print(f"Error in generate_suggestions_for_word: {e}")
-        return []
-def analyze_word(word, paradigm_tables):
-    suffix = find_suffix(word, paradigm_tables)
-    root_word = word[:-len(suffix)] if suffix else word
-    return root_word, suffix
-
-
 def mark_word_as_misspelled(word):
     start_index = textbox.search(word, '1.0', tk.END)
     if start_index:
@@ -199,6 +137,7 @@ def replace_word(start, end, replacement):
 def ignore_word(start, end):
     word = textbox.get(start, end)
     ignored_words.add(word)  # Add the word to the set of ignored words
+    suggestion_cache.invalidate()
     textbox.tag_remove('misspelled', start, end)
 
 def save_ignored_words(filename):
@@ -217,6 +156,7 @@ def load_ignored_words(filename):
             ignored_words.clear()  # Clear existing ignored words before loading new ones
             for line in f:
                 ignored_words.add(line.strip())
+            suggestion_cache.invalidate()
             print(f"Ignored words loaded from {filename}")
     except FileNotFoundError:
         print(f"No ignored words file found at {filename}")
@@ -355,18 +295,12 @@ status_label = ttk.Label(status_frame, textvariable=status_var, background='ligh
 status_label.pack(side='left')
 
 
-trie = setup_trie()
+trie = setup_trie(snapshot_path="dictionary.dawg")
+suggestion_index = setup_suggestion_index(trie, SUGGESTION_ENGINE)
 
 
 textbox.tag_configure('misspelled', underline=True, foreground='red')
 
-paradigm_tables = {
-    "1": ["ತ್ತಿದ್ದಳು", "ತ್ತಿದ್ದನು", "ತ್ತಿದ್ದಾರೆ", "ತ್ತೀಯ", "ತ್ತಾರೆ"],
-    "2": ["ಗಳನ್ನು", "ಗಳಲ್ಲಿ", "ಗಳ"],
-    "3": ["ದ್ದನು", "ದ್ದಳು", "ದ್ದರು"],
-    "4": ["ದ", "ದಲ್ಲಿ", "ದಿಂದ"],
-     }
-
 # Keyboard Layout - Adjusted for more characters per row
 kannada_characters = [
     ['ಅ', 'ಆ', 'ಇ', 'ಈ', 'ಉ', 'ಊ', 'ಋ', 'ಎ', 'ಏ', 'ಐ', 'ಒ', 'ಓ', 'ಔ', 'ಕ', 'ಖ', 'ಗ', 'ಘ', 'ಙ', 'ಚ', 'ಛ'],
@@ -0,0 +1,84 @@
+from functools import lru_cache
+
+
+class SuffixNode:
+    __slots__ = ('children', 'categories')
+
+    def __init__(self):
+        self.children = {}
+        self.categories = []  # Categories whose paradigm ends exactly here; empty for inner nodes
+
+
+class SuffixTrie:
+    """
+    Trie over the reversed paradigm suffixes. Walking a word from its last character visits
+    every suffix it ends with, shortest first, so a lookup costs O(length of the longest suffix)
+    no matter how many suffixes or categories the tables hold. Takes {category: [suffixes]}
+    tables of any size, e.g. paradigm_tables or the 73-category complex_suffixes.
+    """
+    def __init__(self, paradigm_tables=None):
+        self.root = SuffixNode()
+        for category, suffixes in (paradigm_tables or {}).items():
+            for suffix in suffixes:
+                self.insert(suffix, category)
+
+    def insert(self, suffix, category=None):
+        node = self.root
+        for char in reversed(suffix):
+            if char not in node.children:
+                node.children[char] = SuffixNode()
+            node = node.children[char]
+        if category not in node.categories:
+            node.categories.append(category)
+
+    def categories(self, suffix):
+        """ Categories whose paradigm contains exactly this suffix. """
+        node = self.root
+        for char in reversed(suffix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.categories
+
+    def matches(self, word, min_root=0):
+        """
+        All (suffix, categories) pairs the word ends with, longest suffix first.
+        Suffixes that would leave a root shorter than min_root characters are skipped.
+        """
+        found = []
+        node = self.root
+        for i in range(len(word) - 1, min_root - 1, -1):
+            node = node.children.get(word[i])
+            if node is None:
+                break
+            if node.categories:
+                found.append((word[i:], node.categories))
+        found.reverse()
+        return found
+
+    def longest_match(self, word, min_root=0):
+        """ The longest suffix the word ends with, or '' when none does. """
+        longest = ''
+        node = self.root
+        for i in range(len(word) - 1, min_root - 1, -1):
+            node = node.children.get(word[i])
+            if node is None:
+                break
+            if node.categories:
+                longest = word[i:]
+        return longest
+
+
+def compile_suffixes(paradigm_tables):
+    """
+    The SuffixTrie for these tables, reused while their contents stay the same. The cache is
+    keyed by the suffixes themselves, so tables edited in place get a fresh trie, and it only
+    holds a few entries, so discarded tables are not kept alive. Building the key is linear in
+    the number of suffixes, so per-token callers should compile once and pass the SuffixTrie.
+    """
+    return _compile_frozen(tuple((category, tuple(suffixes)) for category, suffixes in paradigm_tables.items()))
+
+
+@lru_cache(maxsize=8)
+def _compile_frozen(frozen_tables):
+    return SuffixTrie(dict(frozen_tables))
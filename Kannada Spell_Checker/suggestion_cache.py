@@ -0,0 +1,52 @@
+from collections import OrderedDict
+
+
+class SuggestionCache:
+    """
+    Bounded LRU cache of suggestion lists keyed by (root, suffix, k).
+    Misspellings repeat heavily in real documents, so most lookups are answered in O(1).
+    The cache is tied to one suggestion index: binding it to a different index, or to a Trie
+    whose version changed since the last lookup, empties it.
+    """
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.stamp = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def bind(self, index):
+        stamp = (id(index), getattr(index, "version", None))
+        if stamp != self.stamp:
+            self.invalidate()
+            self.stamp = stamp
+
+    def get(self, key):
+        suggestions = self.entries.get(key)
+        if suggestions is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return suggestions
+
+    def put(self, key, suggestions):
+        self.entries[key] = suggestions
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self):
+        self.entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
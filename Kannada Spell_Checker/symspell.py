@@ -0,0 +1,126 @@
+import os
+import pickle
+import Levenshtein as lev
+from Dictionary_load import atomic_output, read_categorized_file, source_stamp
+
+INDEX_VERSION = 1
+
+
+def generate_deletes(word, max_distance):
+    """ Return every string obtained by deleting up to max_distance characters from the word. """
+    deletes = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for variant in frontier:
+            for i in range(len(variant)):
+                next_frontier.add(variant[:i] + variant[i + 1:])
+        next_frontier -= deletes
+        deletes |= next_frontier
+        frontier = next_frontier
+    return deletes
+
+
+class SymSpellIndex:
+    """
+    Symmetric delete index: every delete-variant of each dictionary root (up to max_distance)
+    maps to the roots it came from. A query only generates the deletes of the misspelled root,
+    so candidate generation costs a handful of hash lookups instead of a dictionary scan.
+    """
+    def __init__(self, max_distance=2):
+        self.max_distance = max_distance
+        self.words = []
+        self.word_ids = {}
+        self.deletes = {}
+        self.source_stamp = None
+
+    def insert(self, word):
+        if word in self.word_ids:
+            return
+        word_id = len(self.words)
+        self.words.append(word)
+        self.word_ids[word] = word_id
+        for variant in generate_deletes(word, self.max_distance):
+            self.deletes.setdefault(variant, []).append(word_id)
+
+    def fuzzy_search(self, word, max_distance=None, k=8):
+        """ Return up to k (word, distance) pairs within max_distance, closest first. """
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+        candidate_ids = set()
+        for variant in generate_deletes(word, max_distance):
+            ids = self.deletes.get(variant)
+            if ids:
+                candidate_ids.update(ids)
+
+        # Shared deletes only bound the distance from above, so verify each candidate
+        results = []
+        for word_id in candidate_ids:
+            candidate = self.words[word_id]
+            if abs(len(candidate) - len(word)) > max_distance:
+                continue
+            distance = lev.distance(word, candidate, score_cutoff=max_distance)
+            if distance <= max_distance:
+                results.append((distance, word_id))
+        results.sort()
+        return [(self.words[word_id], distance) for distance, word_id in results[:k]]
+
+    def save(self, file_path):
+        with atomic_output(file_path) as temp_path, open(temp_path, "wb") as file:
+            pickle.dump({
+                "version": INDEX_VERSION,
+                "max_distance": self.max_distance,
+                "source_stamp": self.source_stamp,
+                "words": self.words,
+                "deletes": self.deletes,
+            }, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, file_path):
+        with open(file_path, "rb") as file:
+            data = pickle.load(file)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported SymSpell index version in {file_path}")
+        index = cls(data["max_distance"])
+        index.words = data["words"]
+        index.word_ids = {word: word_id for word_id, word in enumerate(index.words)}
+        index.deletes = data["deletes"]
+        index.source_stamp = data["source_stamp"]
+        return index
+
+
+def build_symspell_index(sub_dictionaries, max_distance=2):
+    """ Build the deletion index from the output of read_categorized_file. """
+    index = SymSpellIndex(max_distance)
+    for category, words in sub_dictionaries.items():
+        for word in sorted(words):
+            index.insert(word)
+    return index
+
+
+def load_symspell_index(categorized_path="categorized.txt", index_path="symspell_index.pkl", max_distance=2):
+    """
+    Reload the persisted index, rebuilding and saving it when it is missing or older than
+    the categorized dictionary it was built from.
+    """
+    stamp = source_stamp(categorized_path)
+    if os.path.exists(index_path):
+        try:
+            index = SymSpellIndex.load(index_path)
+            if index.source_stamp == stamp and index.max_distance == max_distance:
+                return index
+        except (ValueError, KeyError, pickle.UnpicklingError, EOFError):
+            pass
+
+    index = build_symspell_index(read_categorized_file(categorized_path), max_distance)
+    index.source_stamp = stamp
+    index.save(index_path)
+    return index
+
+
+if __name__ == "__main__":
+    import time
+    start_time = time.time()
+    index = load_symspell_index()
+    print(f"Indexed {len(index.words)} roots with {len(index.deletes)} delete variants "
+          f"in {time.time() - start_time:.2f} seconds.")
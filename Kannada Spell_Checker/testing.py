@@ -1,6 +1,33 @@
+import os
+import sys
+import tempfile
 import unittest
-from trie import Trie
-from spellcheck import analyze_word, generate_suggestions_for_word, process_misspelled_word, setup_trie
+import Levenshtein as lev
+from trie import Trie, setup_trie_with_categories
+from compact_trie import CompactTrie
+from dawg import DawgDictionary, write_dawg
+from akshara import AksharaEncoder, AksharaIndex, akshara_distance, split_aksharas
+from suggestion_cache import SuggestionCache
+from phonetic import phonetic_key
+from symspell import build_symspell_index, load_symspell_index
+from bktree import BKTree
+from ngram_index import NGramIndex
+from batch_levenshtein import BatchLevenshtein
+from suffix_trie import SuffixTrie
+from Dictionary_load import (categorize_words, complex_suffixes, iter_categorized_file, read_categorized_file,
+                             read_paradigm_index, write_categorized_results, write_paradigm_index)
+from incremental_build import apply_delta
+from morph_lookup import MorphLookup
+from category_index import CategoryIndex
+from checker import (analyze_word, find_suffix, generate_suggestions_for_word, paradigm_suffixes, process_misspelled_word,
+                     setup_trie)
+from frequency import FrequencyIndex, WordFrequencies
+
+# The data cleaning scripts live in a subdirectory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Cleaning data pyhton files"))
+from merge import external_merge_and_deduplicate, merge_and_deduplicate_kannada_files
+from vec_large import chunk_boundaries, extract_words_from_vec_file, extract_words_parallel
+from Final_Kannada_Stemmer import PRIORITY, classify_kannada_words, classify_words, complex_suffixes as stemmer_suffixes
 
 paradigm_tables = {
     "1": ["ತ್ತಿದ್ದಳು", "ತ್ತಿದ್ದನು", "ತ್ತಿದ್ದಾರೆ", "ತ್ತೀಯ", "ತ್ತಾರೆ"],
@@ -9,6 +36,17 @@ paradigm_tables = {
     "4": ["ದ", "ದಲ್ಲಿ", "ದಿಂದ"],
 }
 
+fuzzy_words = ["ಕನ್ನಡ", "ಕನ್ನಡಿ", "ಕನ್ನ", "ಕನ್ನಡಿಗ", "ಭಾರತ", "ಭಾರತಿ", "ಮನೆ", "ಮನೆಗಳು", "ಮರ", "ಮರಗಳಲ್ಲಿ", "ಓದು", "ಓದುತ್ತಿದ್ದನು"]
+fuzzy_queries = ["ಕನ್ನಡು", "ಭರತ", "ಮನ", "ಮರಗಳಲ್ಲ", "ಓದುತ್ತಿದ್ದಳು", "ಕ", "ಪುಸ್ತಕ"]
+
+def brute_force_search(words, word, max_distance=None, k=8):
+    # Score every word and sort by distance; ties keep the order of words
+    scored = [(candidate, lev.distance(word, candidate)) for candidate in words]
+    if max_distance is not None:
+        scored = [pair for pair in scored if pair[1] <= max_distance]
+    scored.sort(key=lambda pair: pair[1])
+    return scored[:k]
+
 class TestDataPreprocessing(unittest.TestCase):
     def test_clean_text(self):
         print("\nRunning test_clean_text...")
@@ -30,6 +68,165 @@ class TestDataPreprocessing(unittest.TestCase):
         self.assertEqual(category, "1")
         print("Test passed: test_categorize_suffix")
 
+    def test_split_aksharas(self):
+        print("\nRunning test_split_aksharas...")
+        aksharas = split_aksharas("ಪಂಚಬ್ರಹ್ಮದೇವತಾರ್ಚನೆ")
+        print("Aksharas for 'ಪಂಚಬ್ರಹ್ಮದೇವತಾರ್ಚನೆ':", aksharas)
+        self.assertEqual(aksharas, ["ಪಂ", "ಚ", "ಬ್ರ", "ಹ್ಮ", "ದೇ", "ವ", "ತಾ", "ರ್ಚ", "ನೆ"])
+        encoder = AksharaEncoder()
+        self.assertEqual(encoder.decode(encoder.encode("ಕನ್ನಡ")), "ಕನ್ನಡ")
+        # A missing vowel sign is one akshara edit
+        self.assertEqual(akshara_distance("ಅಂಗಡಿ", "ಅಂಗಡ", encoder), 1)
+        # Queries never add their unseen aksharas to the table
+        index = AksharaIndex()
+        index.insert("ಕನ್ನಡ")
+        table_size = len(index.encoder.aksharas)
+        self.assertEqual(index.fuzzy_search("ಕನ್ನಡಿಗೆ"), [("ಕನ್ನಡ", 2)])
+        self.assertEqual(len(index.encoder.aksharas), table_size)
+        print("Test passed: test_split_aksharas")
+
+    def test_phonetic_key(self):
+        print("\nRunning test_phonetic_key...")
+        pairs = [("ಭಾರತ", "ಬಾರಟ"), ("ಶಾಲೆ", "ಸಾಲೇ"), ("ಅಂಗಡಿ", "ಅಙ್ಗಡೀ")]
+        for word, misspelling in pairs:
+            print(f"Phonetic keys: '{word}' -> {phonetic_key(word)}, '{misspelling}' -> {phonetic_key(misspelling)}")
+            self.assertEqual(phonetic_key(word), phonetic_key(misspelling))
+        self.assertNotEqual(phonetic_key("ಕನ್ನಡ"), phonetic_key("ಕನ್ನಡಿ"))
+        print("Test passed: test_phonetic_key")
+
+    def test_suffix_trie_longest_match(self):
+        print("\nRunning test_suffix_trie_longest_match...")
+        suffixes = SuffixTrie({"1": ["ಲ್ಲಿ", "ಗಳ"], "4": ["ದಲ್ಲಿ", "ದ"]})
+        matches = suffixes.matches("ಮನೆಯದಲ್ಲಿ")
+        print("Suffix matches for 'ಮನೆಯದಲ್ಲಿ':", matches)
+        self.assertEqual(matches, [("ದಲ್ಲಿ", ["4"]), ("ಲ್ಲಿ", ["1"])])
+        self.assertEqual(suffixes.longest_match("ಮನೆಯದಲ್ಲಿ"), "ದಲ್ಲಿ")
+        self.assertEqual(suffixes.longest_match("ಕನ್ನಡಿ"), "")
+        self.assertEqual(find_suffix("ಮನೆಯದಲ್ಲಿ", {"1": ["ಲ್ಲಿ"], "4": ["ದಲ್ಲಿ"]}), "ದಲ್ಲಿ")
+        # Tables edited in place are recompiled
+        tables = {"1": ["ಲ್ಲಿ"]}
+        self.assertEqual(find_suffix("ಮನೆಯದಲ್ಲಿ", tables), "ಲ್ಲಿ")
+        tables["4"] = ["ದಲ್ಲಿ"]
+        self.assertEqual(find_suffix("ಮನೆಯದಲ್ಲಿ", tables), "ದಲ್ಲಿ")
+        # The checker's tables come precompiled
+        self.assertEqual(find_suffix("ಮರಗಳಲ್ಲಿ", paradigm_suffixes), "ಗಳಲ್ಲಿ")
+        print("Test passed: test_suffix_trie_longest_match")
+
+    def test_categorize_words(self):
+        print("\nRunning test_categorize_words...")
+        words = {"ಮನೆ", "ಮನೆಗಳನ್ನು", "ಮನೆಗಳಲ್ಲಿ", "ಮನೆಗಳ", "ಆಟಗಳ", "ಆಟದ", "ಆಟದಲ್ಲಿ", "ಆಟದಿಂದ"}
+        categorized_roots, categorized_words = categorize_words(words)
+        print("Categorized roots:", categorized_roots)
+        # "ಆಟ" takes only one plural form, so it is not a category 2 root
+        self.assertEqual(categorized_roots[2], {"ಮನೆ"})
+        self.assertEqual(categorized_roots[4], {"ಆಟ"})
+        self.assertEqual(categorized_words, words - {"ಮನೆ", "ಆಟಗಳ"})
+        print("Test passed: test_categorize_words")
+
+    def test_incremental_categorization(self):
+        print("\nRunning test_incremental_categorization...")
+        old_words = {"ಮನೆ", "ಮನೆಗಳನ್ನು", "ಮನೆಗಳಲ್ಲಿ", "ಮನೆಗಳ", "ಆಟದ", "ಆಟದಲ್ಲಿ", "ಆಟದಿಂದ"}
+        new_words = (old_words - {"ಆಟದಿಂದ"}) | {"ಊರು", "ಊರುಗಳನ್ನು", "ಊರುಗಳಲ್ಲಿ", "ಊರುಗಳ"}
+        categorized_roots, _ = categorize_words(old_words)
+        changed = apply_delta(categorized_roots, old_words, new_words, complex_suffixes)
+        self.assertEqual(changed, 2)
+        self.assertEqual(categorized_roots, categorize_words(new_words)[0])
+        print("Test passed: test_incremental_categorization")
+
+    def test_categorized_file_formats(self):
+        print("\nRunning test_categorized_file_formats...")
+        with tempfile.TemporaryDirectory() as directory:
+            text_path = os.path.join(directory, "categorized.txt")
+            with open(text_path, "w", encoding="utf-8") as f:
+                # Words that merely contain a header keyword must not start a new section
+                f.write("Category 2:\nಮನೆ\nCategoryless\n\nUncategorized:\nಕನ್ನಡ\nUncategorized-word")
+            pairs = list(iter_categorized_file(text_path))
+            print("Parsed pairs:", pairs)
+            self.assertEqual(pairs, [("2", "ಮನೆ"), ("2", "Categoryless"),
+                                     ("Uncategorized", "ಕನ್ನಡ"), ("Uncategorized", "Uncategorized-word")])
+            binary_path = os.path.join(directory, "categorized.bin")
+            write_categorized_results({2: {"ಮನೆ"}, 4: set()}, {"ಮನೆಗಳ"}, {"ಮನೆ", "ಮನೆಗಳ", "ಕನ್ನಡ"},
+                                      binary_path, binary=True)
+            self.assertEqual(read_categorized_file(binary_path),
+                             {"2": {"ಮನೆ"}, "4": set(), "Uncategorized": {"ಕನ್ನಡ"}})
+        print("Test passed: test_categorized_file_formats")
+
+    def test_paradigm_index(self):
+        print("\nRunning test_paradigm_index...")
+        classification = {frozenset(["ಗಳ", "ಗಳಲ್ಲಿ"]): ["ಮನೆ", "ಮರ"], frozenset(["ದ್ದನು"]): ["ಬಂ"]}
+        with tempfile.TemporaryDirectory() as directory:
+            index_path = os.path.join(directory, "paradigm_index.txt")
+            write_paradigm_index(classification, index_path)
+            paradigms, sub_dictionaries = read_paradigm_index(index_path)
+            print("Paradigms:", paradigms)
+            self.assertEqual(paradigms, {"P1": ["ಗಳ", "ಗಳಲ್ಲಿ"], "P2": ["ದ್ದನು"]})
+            self.assertEqual(sub_dictionaries, {"P1": {"ಮನೆ", "ಮರ"}, "P2": {"ಬಂ"}})
+            # The trie loader reads the sections like any categorized file
+            self.assertEqual(setup_trie(index_path).search("ಮರ"), (True, frozenset(["P1"])))
+        print("Test passed: test_paradigm_index")
+
+    def test_external_merge(self):
+        print("\nRunning test_external_merge...")
+        with tempfile.TemporaryDirectory() as directory:
+            first, second = os.path.join(directory, "wiki.txt"), os.path.join(directory, "roots.txt")
+            with open(first, "w", encoding="utf-8") as f:
+                f.write("ಮನೆ ಕನ್ನಡ ಮರ\n\nಕನ್ನಡ  ಓದು\n ಭಾರತ\n")
+            with open(second, "w", encoding="utf-8") as f:
+                f.write("ಮರ\nಊರು\nಮನೆ ಆಟ\n")
+            expected_path, merged_path = os.path.join(directory, "expected.txt"), os.path.join(directory, "merged.txt")
+            merge_and_deduplicate_kannada_files(first, second, expected_path)
+            # A tiny budget spills a run per word, and fan_in=2 forces several merge passes
+            external_merge_and_deduplicate([first, second], merged_path, memory_budget=1, fan_in=2)
+            with open(expected_path, encoding="utf-8") as expected, open(merged_path, encoding="utf-8") as merged:
+                self.assertEqual(merged.read(), expected.read())
+            self.assertEqual(sorted(os.listdir(directory)), ["expected.txt", "merged.txt", "roots.txt", "wiki.txt"])
+        print("Test passed: test_external_merge")
+
+    def test_extract_vec_words(self):
+        print("\nRunning test_extract_vec_words...")
+        with tempfile.TemporaryDirectory() as directory:
+            vec_path = os.path.join(directory, "words.vec")
+            with open(vec_path, "w", encoding="utf-8") as f:
+                # The last line has no newline
+                f.write("6 2\nಮನೆ 0.1 0.2\nಕನ್ನಡ -0.3 0.4\n</s> 0.5 0.6\nಓದುತ್ತಿದ್ದಳು 0.7 0.8\nಮರ 0.9 1.0\nಆಟ 1.1 1.2")
+            with open(vec_path, "rb") as f:
+                data = f.read()
+            # A tiny chunk size gives many chunks; each ends on a newline and they cover the file
+            boundaries = chunk_boundaries(data, data.find(b"\n") + 1, 16)
+            self.assertGreater(len(boundaries), 2)
+            self.assertEqual([start for start, _ in boundaries[1:]], [end for _, end in boundaries[:-1]])
+            self.assertEqual(boundaries[-1][1], len(data))
+            self.assertTrue(all(data[end - 1:end] == b"\n" for _, end in boundaries[:-1]))
+            expected_path = os.path.join(directory, "expected.txt")
+            extract_words_from_vec_file(vec_path, expected_path)
+            with open(expected_path, encoding="utf-8") as f:
+                expected = f.read()
+            for workers in (1, 2):
+                output_path = os.path.join(directory, f"extracted_{workers}.txt")
+                extract_words_parallel(vec_path, output_path, workers=workers, chunk_size=16)
+                with open(output_path, encoding="utf-8") as f:
+                    self.assertEqual(f.read(), expected)
+        print("Test passed: test_extract_vec_words")
+
+    def test_stemmer_classification(self):
+        print("\nRunning test_stemmer_classification...")
+        def priority_loop(word):
+            # The original classifier: every table in priority order, first suffix leaving a 2-character root
+            for category in PRIORITY:
+                for suffix in stemmer_suffixes[category]:
+                    if len(word) > len(suffix) + 1 and word.endswith(suffix):
+                        return [category]
+            return ['unclassified']
+        suffixes = sorted({suffix for table in stemmer_suffixes.values() for suffix in table})
+        words = [root + suffix for root in ["ಮನೆ", "ಕ", "ಓದು"] for suffix in suffixes] + ["", "ಕ", "ಮನೆ", "ಕನ್ನಡ"]
+        for word in words:
+            self.assertEqual(classify_kannada_words(word), priority_loop(word), word)
+        expected = {}
+        for word in words:
+            expected.setdefault(priority_loop(word)[0], []).append(word)
+        self.assertEqual(classify_words(words, workers=2, chunk_size=100), expected)
+        print("Test passed: test_stemmer_classification")
+
 class TestTrieOperations(unittest.TestCase):
     def test_insert_and_search(self):
         print("\nRunning test_insert_and_search...")
@@ -52,6 +249,191 @@ class TestTrieOperations(unittest.TestCase):
         print("Test passed: test_search_nonexistent")
         print("------------------------------------------------------------")
 
+    def test_multiple_categories(self):
+        print("\nRunning test_multiple_categories...")
+        trie = Trie()
+        trie.insert("ಆಟ", "2")
+        trie.insert("ಆಟ", "4")
+        trie.insert("ಕನ್ನಡ")
+        print("Categories of 'ಆಟ':", trie.search("ಆಟ")[1])
+        self.assertEqual(trie.search("ಆಟ"), (True, {"2", "4"}))
+        self.assertEqual(trie.search("ಕನ್ನಡ"), (True, set()))
+        # Each suffix is accepted only after a root whose categories license it
+        self.assertFalse(process_misspelled_word("ಆಟಗಳನ್ನು", trie, paradigm_tables))
+        self.assertFalse(process_misspelled_word("ಆಟದಲ್ಲಿ", trie, paradigm_tables))
+        self.assertTrue(process_misspelled_word("ಆಟದ್ದನು", trie, paradigm_tables))
+        self.assertTrue(process_misspelled_word("ಕನ್ನಡಗಳ", trie, paradigm_tables))
+        print("Test passed: test_multiple_categories")
+        print("------------------------------------------------------------")
+
+    def test_prefix_enumeration(self):
+        print("\nRunning test_prefix_enumeration...")
+        trie = Trie()
+        for word in ["ಕನ್ನಡ", "ಕನ್ನಡಿ", "ಕನ್ನ", "ಭಾರತ"]:
+            trie.insert(word, "1")
+        words = trie.iter_words("ಕನ್ನ")
+        self.assertEqual(next(words), "ಕನ್ನ")
+        self.assertEqual(list(words), ["ಕನ್ನಡ", "ಕನ್ನಡಿ"])
+        self.assertEqual(trie.count("ಕನ್ನ"), 3)
+        self.assertEqual(trie.count("ತ"), 0)
+        self.assertEqual(list(trie.iter_with_categories("ಭಾ")), [("ಭಾರತ", {"1"})])
+        # Deep words are enumerated without recursion
+        trie.insert("ಅ" * 5000)
+        self.assertEqual(trie.count(), 5)
+        self.assertEqual(len(trie.get_all_words("ಅ")[0]), 5000)
+        print("Test passed: test_prefix_enumeration")
+        print("------------------------------------------------------------")
+
+    def test_fuzzy_search(self):
+        print("\nRunning test_fuzzy_search...")
+        trie = Trie()
+        for word in ["ಕನ್ನಡ", "ಕನ್ನಡಿ", "ಕನ್ನ", "ಭಾರತ"]:
+            trie.insert(word)
+        result = trie.fuzzy_search("ಕನ್ನಡು", k=2)
+        print("Fuzzy search for 'ಕನ್ನಡು':", result)
+        self.assertEqual(result, [("ಕನ್ನಡ", 1), ("ಕನ್ನಡಿ", 1)])
+        self.assertEqual(trie.fuzzy_search("ಕನ್ನಡು", max_distance=0), [])
+        print("Test passed: test_fuzzy_search")
+        print("------------------------------------------------------------")
+
+    def test_bktree(self):
+        print("\nRunning test_bktree...")
+        tree = BKTree()
+        for word in fuzzy_words:
+            tree.insert(word)
+        for word in fuzzy_queries:
+            result = tree.fuzzy_search(word, k=3)
+            print(f"BK-tree search for '{word}':", result)
+            self.assertEqual(result, brute_force_search(fuzzy_words, word, k=3))
+            self.assertEqual(tree.fuzzy_search(word, max_distance=1), brute_force_search(fuzzy_words, word, 1))
+        print("Test passed: test_bktree")
+
+    def test_ngram_index(self):
+        print("\nRunning test_ngram_index...")
+        index = NGramIndex()
+        for word in fuzzy_words:
+            index.insert(word)
+        for word in fuzzy_queries:
+            result = index.fuzzy_search(word, k=3)
+            print(f"N-gram search for '{word}':", result)
+            self.assertEqual(result, brute_force_search(fuzzy_words, word, k=3))
+            self.assertEqual(index.fuzzy_search(word, max_distance=1), brute_force_search(fuzzy_words, word, 1))
+        print("Test passed: test_ngram_index")
+
+    def test_batch_levenshtein(self):
+        print("\nRunning test_batch_levenshtein...")
+        words = fuzzy_words + ["", "ಪಂಚಬ್ರಹ್ಮದೇವತಾರ್ಚನೆಯಲ್ಲಿ", "ಕ್ವಾಪಿನವೇತ್ತೀಷ್ಟಮನಿಷ್ಟಂ"]
+        index = BatchLevenshtein(words)
+        queries = fuzzy_queries + ["", "ಪಂಚಬ್ಹ್ದೇವತಾರ್ನೆ", "ಕ್ವಾಪಿನವೇತ್ತೀಷ್ಟಮನಿಷ್ಟಂಗಳನ್ನು"]
+        # k covers the whole dictionary, so every vectorized distance is checked
+        for word, result in zip(queries, index.fuzzy_search_many(queries, k=len(words))):
+            self.assertEqual(dict(result), {candidate: lev.distance(word, candidate) for candidate in words})
+            self.assertEqual(index.fuzzy_search(word, k=3), brute_force_search(words, word, k=3))
+        print("Test passed: test_batch_levenshtein")
+
+    def test_symspell_index(self):
+        print("\nRunning test_symspell_index...")
+        index = build_symspell_index({"1": fuzzy_words})
+        for word in fuzzy_queries:
+            # SymSpell only sees candidates within its own max_distance
+            self.assertEqual(index.fuzzy_search(word, k=5), brute_force_search(index.words, word, 2, k=5))
+        with tempfile.TemporaryDirectory() as directory:
+            categorized_path = os.path.join(directory, "categorized.txt")
+            index_path = os.path.join(directory, "symspell_index.pkl")
+            with open(categorized_path, "w", encoding="utf-8") as f:
+                f.write("Category 1:\n" + "\n".join(fuzzy_words))
+            built = load_symspell_index(categorized_path, index_path)
+            reloaded = load_symspell_index(categorized_path, index_path)
+            self.assertEqual((reloaded.words, reloaded.deletes), (built.words, built.deletes))
+            # A changed source invalidates the saved index
+            with open(categorized_path, "a", encoding="utf-8") as f:
+                f.write("\nಪುಸ್ತಕ")
+            rebuilt = load_symspell_index(categorized_path, index_path)
+            print("Search after the source changed:", rebuilt.fuzzy_search("ಪುಸ್ತಕ", k=1))
+            self.assertEqual(rebuilt.fuzzy_search("ಪುಸ್ತಕ", k=1), [("ಪುಸ್ತಕ", 0)])
+        print("Test passed: test_symspell_index")
+
+    def test_frequency_index(self):
+        print("\nRunning test_frequency_index...")
+        trie = Trie()
+        for word in ["ಕನ್ನಡ", "ಕನ್ನಡಿ", "ಕನ್ನ", "ಭಾರತ"]:
+            trie.insert(word)
+        index = FrequencyIndex(trie, WordFrequencies({"ಕನ್ನಡಿ": 50, "ಕನ್ನ": 3, "ಮನೆ": 9}), tier_sizes=(1,))
+        result = index.fuzzy_search("ಕನ್ನಡು", k=3)
+        print("Frequency-ranked search for 'ಕನ್ನಡು':", result)
+        # The frequent word wins the tie at distance 1
+        self.assertEqual(result, [("ಕನ್ನಡಿ", 1), ("ಕನ್ನಡ", 1), ("ಕನ್ನ", 2)])
+        self.assertEqual(index.fuzzy_search("ಕನ್ನಡು", k=1), [("ಕನ್ನಡಿ", 1)])
+        # Frequency only breaks ties: a rare word at distance 1 beats a frequent one at distance 2
+        trie.insert("ಕನ್ನಡಿಗ")
+        trie.insert("ಮನೆ")
+        index = FrequencyIndex(trie, WordFrequencies({"ಕನ್ನಡಿಗ": 50}), tier_sizes=(1,))
+        self.assertEqual(index.fuzzy_search("ಕನ್ನಡು", k=1), [("ಕನ್ನಡ", 1)])
+        self.assertEqual(len(index.fuzzy_search("ಕನ್ನಡು", k=8)), len(trie.fuzzy_search("ಕನ್ನಡು", k=8)))
+        # Without counts the ranking is the trie's own
+        self.assertEqual(FrequencyIndex(trie, WordFrequencies()).fuzzy_search("ಕನ್ನಡು", k=3),
+                         trie.fuzzy_search("ಕನ್ನಡು", k=3))
+        print("Test passed: test_frequency_index")
+
+    def test_compact_trie_matches_trie(self):
+        print("\nRunning test_compact_trie_matches_trie...")
+        trie = Trie()
+        for word, category in [("ಕನ್ನಡ", "ನಾಮಪದ"), ("ಕನ್ನಡಿ", "ನಾಮಪದ"), ("ಕನ್ನ", None), ("ಓದು", "ಕ್ರಿಯಾಪದ")]:
+            trie.insert(word, category)
+        compact = CompactTrie.from_trie(trie)
+        for word in ["ಕನ್ನಡ", "ಕನ್ನ", "ಕನ್", "ಓದು", "ಭಾರತ"]:
+            self.assertEqual(compact.search(word), trie.search(word))
+        self.assertEqual(compact.get_longest_valid_root("ಕನ್ನಡದಲ್ಲಿ"), "ಕನ್ನಡ")
+        self.assertEqual(compact.fuzzy_search("ಕನ್ನಡು", k=2), [("ಕನ್ನಡ", 1), ("ಕನ್ನಡಿ", 1)])
+        compact.insert("ಭಾರತ")
+        self.assertEqual(compact.search("ಭಾರತ"), (True, set()))
+        print("Test passed: test_compact_trie_matches_trie")
+        print("------------------------------------------------------------")
+
+    def test_dawg_snapshot(self):
+        print("\nRunning test_dawg_snapshot...")
+        entries = [("ಕನ್ನಡ", "ನಾಮಪದ"), ("ಬನ್ನಡ", "ನಾಮಪದ"), ("ಕನ್ನ", None)]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "dictionary.dawg")
+            states, _ = write_dawg(path, entries)
+            # "ಕನ್ನಡ" and "ಬನ್ನಡ" end in the same category, so their suffix path is shared
+            self.assertLess(states, 1 + len("ಕನ್ನಡ") + len("ಬನ್ನಡ"))
+            dawg = DawgDictionary(path)
+            self.assertEqual(sorted(dawg.get_all_words_with_categories()),
+                             [("ಕನ್ನ", set()), ("ಕನ್ನಡ", {"ನಾಮಪದ"}), ("ಬನ್ನಡ", {"ನಾಮಪದ"})])
+            self.assertEqual(dawg.search("ಬನ್ನಡ"), (True, {"ನಾಮಪದ"}))
+            self.assertEqual(dawg.search("ಬನ್ನ"), (False, set()))
+            self.assertEqual(dawg.get_longest_valid_root("ಕನ್ನಡದಲ್ಲಿ"), "ಕನ್ನಡ")
+            dawg.close()
+        print("Test passed: test_dawg_snapshot")
+        print("------------------------------------------------------------")
+
+    def test_morph_lookup(self):
+        print("\nRunning test_morph_lookup...")
+        sub_dictionaries = {"2": {"ಮನೆ"}, "4": {"ಆಟ"}}
+        morph = MorphLookup(setup_trie_with_categories(sub_dictionaries), paradigm_tables)
+        self.assertEqual(morph.analyze("ಮನೆಗಳನ್ನು"), ("ಮನೆ", "ಗಳನ್ನು", {"2"}))
+        self.assertEqual(morph.search("ಆಟದಲ್ಲಿ"), (True, {"4"}))
+        self.assertEqual(morph.search("ಆಟ"), (True, {"4"}))
+        # A suffix from another category's paradigm is not a valid form
+        self.assertEqual(morph.search("ಆಟಗಳನ್ನು"), (False, set()))
+        print("Test passed: test_morph_lookup")
+        print("------------------------------------------------------------")
+
+    def test_category_index(self):
+        print("\nRunning test_category_index...")
+        sub_dictionaries = {"2": {"ಮನೆ", "ಅಂಗಡಿ"}, "4": {"ಮನ", "ಆಟ"}}
+        trie = setup_trie_with_categories(sub_dictionaries)
+        index = CategoryIndex.from_sub_dictionaries(sub_dictionaries, paradigm_tables, trie)
+        # "ಮನ" is closer to the misspelt root but cannot take the plural suffix
+        self.assertEqual(trie.fuzzy_search("ಮನಿ", k=1), [("ಮನ", 1)])
+        self.assertEqual(index.fuzzy_search_licensed("ಮನಿ", "ಗಳನ್ನು", k=1), [("ಮನೆ", 1)])
+        suggestions = generate_suggestions_for_word("ಮನಿಗಳನ್ನು", index, paradigm_tables)
+        print("Suggestions for 'ಮನಿಗಳನ್ನು':", suggestions)
+        self.assertEqual(suggestions, ["ಮನೆಗಳನ್ನು", "ಅಂಗಡಿಗಳನ್ನು"])
+        print("Test passed: test_category_index")
+        print("------------------------------------------------------------")
+
     def test_stemming(self):
         print("\nRunning test_stemming...")
         root, suffix = analyze_word("ಪ್ರೀತಿಸುತ್ತಿದ್ದಳು", paradigm_tables)
@@ -61,6 +443,25 @@ class TestTrieOperations(unittest.TestCase):
         print("Test passed: test_stemming")
         print("------------------------------------------------------------")
 
+class TestSuggestionCache(unittest.TestCase):
+    def test_lru_eviction_and_stats(self):
+        print("\nRunning test_lru_eviction_and_stats...")
+        cache = SuggestionCache(maxsize=2)
+        cache.put(("ಅಂಗಡ", "ಗಳನ್ನು", 8), ("ಅಂಗಡಿಗಳನ್ನು",))
+        cache.put(("ಸಾಕಾಣಿಗ", "", 8), ("ಸಾಕಾಣಿಗೆ",))
+        self.assertEqual(cache.get(("ಅಂಗಡ", "ಗಳನ್ನು", 8)), ("ಅಂಗಡಿಗಳನ್ನು",))
+        cache.put(("ಕನ್ನಡು", "", 8), ("ಕನ್ನಡ",))  # Evicts the least recently used entry
+        self.assertIsNone(cache.get(("ಸಾಕಾಣಿಗ", "", 8)))
+        print("Cache stats:", cache.stats())
+        self.assertEqual((cache.hits, cache.misses, cache.evictions), (1, 1, 1))
+
+        trie = Trie()
+        cache.bind(trie)
+        trie.insert("ಕನ್ನಡ")
+        cache.bind(trie)  # The dictionary changed, so the cache is emptied
+        self.assertEqual(cache.stats()["size"], 0)
+        print("Test passed: test_lru_eviction_and_stats")
+
 def clean_text(text):
     import re
     return re.sub(r"[^\u0C80-\u0CFF]", "", text).strip()
@@ -73,9 +474,21 @@ def categorize_suffix(word, paradigm_tables):
     return None
 
 class TestSpellChecking(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Compile the DAWG snapshot once into a temporary directory; every test maps it
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.snapshot_path = os.path.join(cls.directory.name, "dictionary.dawg")
+        setup_trie(snapshot_path=cls.snapshot_path).close()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
     def setUp(self):
         # Set up the trie for testing
-        self.trie = setup_trie()
+        self.trie = setup_trie(snapshot_path=self.snapshot_path)
+        self.addCleanup(self.trie.close)
         self.paradigm_tables = {
             "1": ["ತ್ತಿದ್ದಳು", "ತ್ತಿದ್ದನು", "ತ್ತಿದ್ದಾರೆ", "ತ್ತೀಯ", "ತ್ತಾರೆ"],
             "2": ["ಗಳನ್ನು", "ಗಳಲ್ಲಿ", "ಗಳ"],
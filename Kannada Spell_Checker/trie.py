@@ -1,60 +1,121 @@
+import heapq
+import Levenshtein as lev
 from Dictionary_load import read_categorized_file
 class TrieNode:
+    __slots__ = ('children', 'isEndOfWord', 'categories')
+
     def __init__(self):
         self.children = {}
         self.isEndOfWord = False
-        self.category = None
+        self.categories = 0  # Bitset of interned category IDs; a word can belong to several
 
 class Trie:
     def __init__(self):
         self.root = TrieNode()
+        self.version = 0  # Bumped on every insert so caches can tell the dictionary changed
+        self.category_names = []  # category ID -> name
+        self.category_ids = {}  # name -> category ID
+        self._category_sets = {0: frozenset()}  # bitset -> frozenset of names, decoded once
+
+    def category_id(self, category):
+        category_id = self.category_ids.get(category)
+        if category_id is None:
+            category_id = self.category_ids[category] = len(self.category_names)
+            self.category_names.append(category)
+        return category_id
+
+    def category_mask(self, categories):
+        # Bitset for a collection of category names; names never inserted match nothing
+        mask = 0
+        for category in categories:
+            if category in self.category_ids:
+                mask |= 1 << self.category_ids[category]
+        return mask
+
+    def category_set(self, mask):
+        categories = self._category_sets.get(mask)
+        if categories is None:
+            categories = frozenset(name for i, name in enumerate(self.category_names) if mask >> i & 1)
+            self._category_sets[mask] = categories
+        return categories
 
     def insert(self, word, category=None):
+        self.version += 1
         node = self.root
         for char in word:
             if char not in node.children:
                 node.children[char] = TrieNode()
             node = node.children[char]
         node.isEndOfWord = True
-        node.category = category
+        if category is not None:
+            node.categories |= 1 << self.category_id(category)
 
     def search(self, word):
+        # Returns (exists, frozenset of every category the word was inserted under)
         node = self.root
         for char in word:
             if char in node.children:
                 node = node.children[char]
             else:
-                return False, None
-        return node.isEndOfWord, node.category
+                return False, frozenset()
+        return node.isEndOfWord, self.category_set(node.categories)
+
+    def _find(self, prefix):
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
 
-    def get_all_words(self, node=None, word='', words=None):
-        if words is None:
-            words = []
+    def _iter_terminals(self, prefix):
+        node = self._find(prefix)
         if node is None:
-            node = self.root
+            return iter(())
+        return iter_terminals(node, lambda node: node.children.items(), lambda node: node.isEndOfWord, prefix)
 
-        if node.isEndOfWord:
-            words.append(word)
+    def iter_words(self, prefix=''):
+        """ Lazily yield every word starting with prefix, depth-first; stop whenever you like. """
+        for word, _ in self._iter_terminals(prefix):
+            yield word
 
-        for char, next_node in node.children.items():
-            self.get_all_words(next_node, word + char, words)
+    def iter_with_categories(self, prefix=''):
+        for word, node in self._iter_terminals(prefix):
+            yield word, self.category_set(node.categories)
 
-        return words
-    
-    def get_all_words_with_categories(self, node=None, word='', words_with_cats=None):
-        if words_with_cats is None:
-            words_with_cats = []
-        if node is None:
-            node = self.root
+    def count(self, prefix=''):
+        # Number of words starting with prefix; walks the nodes without building any strings
+        node = self._find(prefix)
+        total = 0
+        stack = [node] if node is not None else []
+        while stack:
+            node = stack.pop()
+            total += node.isEndOfWord
+            stack.extend(node.children.values())
+        return total
+
+    def get_all_words(self, prefix=''):
+        return list(self.iter_words(prefix))
 
-        if node.isEndOfWord:
-            words_with_cats.append((word, node.category))
+    def get_all_words_with_categories(self, prefix=''):
+        return list(self.iter_with_categories(prefix))
 
-        for char, next_node in node.children.items():
-            self.get_all_words_with_categories(next_node, word + char, words_with_cats)
+    def fuzzy_search(self, word, max_distance=None, k=8):
+        """
+        Return up to k (word, distance) pairs closest to the word by Levenshtein distance.
+        The trie is walked within WALK_RADIUS edits first; when that finds fewer than k words,
+        the words are streamed through the Levenshtein library instead (see scan_words).
+        Ties keep the order of get_all_words, matching a full scan sorted by distance.
+        """
+        if k <= 0:
+            return []
+        radius = WALK_RADIUS if max_distance is None else min(WALK_RADIUS, max_distance)
+        found = bounded_fuzzy_search(
+            self.root, lambda node: node.children.items(), lambda node: node.isEndOfWord, word, radius, k)
+        if len(found) >= k or radius == max_distance:
+            return found
+        return scan_words(self.iter_words(), word, max_distance, k)
 
-        return words_with_cats
- 
     #Check for words with invalid suffix:
     def get_longest_valid_root(self, word):
         node = self.root
@@ -68,6 +129,132 @@ class Trie:
                 break
         return valid_root
 
+def iter_terminals(node, children, is_end, prefix=''):
+    """
+    Depth-first (word, node) pairs for every word ending at or below node, which spells prefix,
+    in the same order as a recursive walk. Uses a stack of child iterators and one shared path,
+    so there is no recursion limit and each word is joined once when it is yielded.
+    """
+    if is_end(node):
+        yield prefix, node
+    path = list(prefix)
+    stack = [iter(children(node))]
+    while stack:
+        for char, child in stack[-1]:
+            path.append(char)
+            if is_end(child):
+                yield ''.join(path), child
+            stack.append(iter(children(child)))
+            break
+        else:
+            stack.pop()
+            if stack:
+                path.pop()
+
+def bounded_fuzzy_search(root, children, is_end, word, max_distance=None, k=8):
+    """
+    Depth-first Levenshtein search over any trie layout: children(node) yields (char, child)
+    pairs in enumeration order and is_end(node) tells whether a word ends at the node.
+    The bound is max_distance, tightened to the k-th best distance once k words are found;
+    a subtree is dropped when its row minimum exceeds it. Each row is only computed within
+    bound cells of the diagonal, since cells farther out can never come back under it.
+    """
+    if k <= 0:
+        return []
+    size = len(word) + 1
+    kth = []  # max-heap (negated) of the k best distances seen so far
+    candidates = []
+    bound = max_distance
+    stack = [(root, '', list(range(size)))]
+    while stack:
+        node, prefix, prev_row = stack.pop()
+        if is_end(node):
+            distance = prev_row[-1]
+            if bound is None or distance <= bound:
+                candidates.append((distance, len(candidates), prefix))
+                if len(kth) < k:
+                    heapq.heappush(kth, -distance)
+                elif distance < -kth[0]:
+                    heapq.heapreplace(kth, -distance)
+                if len(kth) == k and (bound is None or -kth[0] < bound):
+                    bound = -kth[0]
+        depth = len(prefix) + 1
+        if bound is None:
+            first, last, far = 1, size, None
+        else:
+            if depth - bound > len(word):
+                continue
+            first, last, far = max(1, depth - bound), min(size, depth + bound + 1), bound + 1
+        pushed = []
+        for char, child in children(node):
+            row = [far] * size if far is not None else [0] * size
+            left = row[0] = depth if first == 1 else far
+            row_min = left
+            for j in range(first, last):
+                cost = prev_row[j - 1] + (word[j - 1] != char)
+                above = prev_row[j] + 1
+                if above < cost:
+                    cost = above
+                if left + 1 < cost:
+                    cost = left + 1
+                left = row[j] = cost
+                if cost < row_min:
+                    row_min = cost
+            if bound is None or row_min <= bound:
+                pushed.append((child, prefix + char, row))
+        # Reversed so children are popped, and words found, in enumeration order
+        stack.extend(reversed(pushed))
+    # Discovery order is depth-first get_all_words order, so equal distances keep it
+    candidates.sort()
+    return [(found, distance) for distance, _, found in candidates[:k]]
+
+WALK_RADIUS = 1  # Beyond one edit the pure-Python walk visits most nodes and a scan is faster
+DEEPEN_RADIUS = 2  # Past this a repeated walk costs more than one walk pruned by the k-th distance
+
+def fuzzy_search_dictionary(walk, word, max_distance=None, k=8):
+    """
+    Top-k search for the compact layouts, which keep no word list to scan. walk(radius) is the
+    bounded trie walk; the radius starts at one edit and grows up to DEEPEN_RADIUS until it
+    holds k words, which are then the exact top k, so the common case only visits nodes near
+    the query. Failing that, a last walk within max_distance prunes on the k-th best distance.
+    """
+    if k <= 0:
+        return []
+    radius = 1
+    while radius <= DEEPEN_RADIUS and radius < len(word) and (max_distance is None or radius < max_distance):
+        found = walk(radius)
+        if len(found) >= k:
+            return found
+        radius += 1
+    return walk(max_distance)
+
+def scan_words(words, word, max_distance=None, k=8):
+    """
+    Top-k (word, distance) pairs from words, streamed in get_all_words order. Candidates whose
+    length differs from the query's by more than the current k-th distance are skipped unscored.
+    """
+    # Max-heap (negated) of the k best (distance, position) pairs
+    best = []
+    bound = max_distance
+    for position, candidate in enumerate(words):
+        # A length difference is a lower bound on the distance
+        if bound is not None and abs(len(candidate) - len(word)) > bound:
+            continue
+        distance = lev.distance(word, candidate, score_cutoff=bound)
+        if bound is not None and distance > bound:
+            continue
+        # Later positions lose ties, so only a strictly smaller distance displaces the k-th
+        if len(best) < k:
+            heapq.heappush(best, (-distance, -position, candidate))
+        elif distance < -best[0][0]:
+            heapq.heapreplace(best, (-distance, -position, candidate))
+        else:
+            continue
+        if len(best) == k:
+            bound = -best[0][0] if max_distance is None else min(max_distance, -best[0][0])
+    best.sort(reverse=True)
+    return [(candidate, -distance) for distance, _, candidate in best]
+
 def setup_trie_with_categories(sub_dictionaries):
     trie = Trie()
     for category, words in sub_dictionaries.items():
@@ -95,8 +282,8 @@ def test_trie_operations(trie):
     test_words = ["ಪ್ರಪಂಚದಲ್ಲಿ", "ಮುಖ್ಯವೇನೆಂದರೆ", "ಆಟದಲ್ಲಿ", "ಸಮಾಜದ", "ಸೋತುಬಿಡುತ್ತೇವೆ"]
     print("Testing trie operations...")
     for word in test_words:
-        exists, category = trie.search(word)
-        print(f"Word: {word}, Exists: {exists}, Category: {category if exists else 'N/A'}")
+        exists, categories = trie.search(word)
+        print(f"Word: {word}, Exists: {exists}, Categories: {', '.join(sorted(categories)) if exists else 'N/A'}")
 
 def main():
     sub_dictionaries = read_categorized_file("categorized.txt")